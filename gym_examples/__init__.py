@@ -2,25 +2,40 @@ from gymnasium.envs.registration import register
 
 register(
     id="gym_examples/GridWorld-v0",
-    entry_point="gym_examples.envs:GridWorldEnv",
+    entry_point="gym_examples.envs.grid_world:GridWorldEnv",
 )
 
 register(
     id="gym_examples/PtzCamera",
-    entry_point="gym_examples.envs:PtzCameraEnv",
+    entry_point="gym_examples.envs.ptz_camera:PtzCameraEnv",
 )
 
 register(
     id="gym_examples/UnrestrictedPtzCamera",
-    entry_point="gym_examples.envs:UnrestrictedPtzCameraEnv",
+    entry_point="gym_examples.envs.unrestricted_ptz_camera:UnrestrictedPtzCameraEnv",
 )
 
 register(
     id="gym_examples/PtzCameraReal",
-    entry_point="gym_examples.envs:PtzCameraRealEnv",
+    entry_point="gym_examples.envs.ptz_camera_real:PtzCameraRealEnv",
 )
 
 register(
     id="gym_examples/UnrestrictedPtzCameraReal",
-    entry_point="gym_examples.envs:UnrestrictedPtzCameraRealEnv",
+    entry_point="gym_examples.envs.unrestricted_ptz_camera_real:UnrestrictedPtzCameraRealEnv",
+)
+
+register(
+    id="gym_examples/MultiPtzCameraReal",
+    entry_point="gym_examples.envs.multi_ptz_camera_real:MultiPtzCameraRealEnv",
+)
+
+register(
+    id="gym_examples/ContinuousPtzCamera",
+    entry_point="gym_examples.envs.continuous_ptz_camera:ContinuousPtzCameraEnv",
+)
+
+register(
+    id="gym_examples/ContinuousPtzCameraReal",
+    entry_point="gym_examples.envs.continuous_ptz_camera_real:ContinuousPtzCameraRealEnv",
 )
@@ -1,5 +1,28 @@
-from gym_examples.envs.grid_world import GridWorldEnv
-from gym_examples.envs.ptz_camera import PtzCameraEnv
-from gym_examples.envs.unrestricted_ptz_camera import UnrestrictedPtzCameraEnv
-from gym_examples.envs.ptz_camera_real import PtzCameraRealEnv
-from gym_examples.envs.unrestricted_ptz_camera_real import UnrestrictedPtzCameraRealEnv
+import importlib
+
+# Env modules are imported on first access, so that e.g. making one env does
+# not pay for importing the dependencies of all the others.
+_env_modules = {
+    "GridWorldEnv": "grid_world",
+    "PtzCameraEnv": "ptz_camera",
+    "UnrestrictedPtzCameraEnv": "unrestricted_ptz_camera",
+    "PtzCameraRealEnv": "ptz_camera_real",
+    "UnrestrictedPtzCameraRealEnv": "unrestricted_ptz_camera_real",
+    "MultiPtzCameraRealEnv": "multi_ptz_camera_real",
+    "ContinuousPtzCameraEnv": "continuous_ptz_camera",
+    "ContinuousPtzCameraRealEnv": "continuous_ptz_camera_real",
+    "AsyncPtzCameraRealEnv": "async_ptz_camera_real",
+}
+
+__all__ = list(_env_modules)
+
+
+def __getattr__(name):
+    if name in _env_modules:
+        module = importlib.import_module(f"{__name__}.{_env_modules[name]}")
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
@@ -0,0 +1,73 @@
+import asyncio
+import functools
+
+
+class AsyncPtzCameraRealEnv:
+    """
+    Asyncio facade over a `PtzCameraRealEnv` (or a subclass), for serving
+    many camera sessions from one event loop. `env` may be wrapped, e.g. as
+    returned by `gym.make`; the prefetch hooks are reached via `env.unwrapped`.
+
+    PNG decode never runs on the event loop: `reset` runs in `executor`, and
+    after every `reset`/`step` the next frame is decoded in `executor` while
+    the caller computes its next action. `step` then only crops the viewport
+    out of the already decoded frame, which is a numpy view.
+
+    `executor`: a `concurrent.futures.Executor`, or None for the loop's
+    default executor. Sessions can share one executor.
+    """
+
+    def __init__(self, env, executor=None):
+        self.env = env
+        self.executor = executor
+        self._prefetch_frame_id = None
+        self._prefetch_future = None
+
+    @property
+    def observation_space(self):
+        return self.env.observation_space
+
+    @property
+    def action_space(self):
+        return self.env.action_space
+
+    async def reset(self, seed=None, options=None):
+        self._cancel_prefetch()
+        loop = asyncio.get_running_loop()
+        ret = await loop.run_in_executor(
+            self.executor,
+            functools.partial(self.env.reset, seed=seed, options=options),
+        )
+        self._prefetch_next_frame()
+        return ret
+
+    async def step(self, action):
+        if self._prefetch_future is not None:
+            img = await self._prefetch_future
+            self.env.unwrapped._prefetched_frames[self._prefetch_frame_id] = img
+            self._prefetch_future = None
+
+        ret = self.env.step(action)
+        self._prefetch_next_frame()
+        return ret
+
+    def close(self):
+        self._cancel_prefetch()
+        self.env.close()
+
+    def _prefetch_next_frame(self):
+        env = self.env.unwrapped
+        frame_id = env.frame_id
+        if frame_id >= len(env.frames):
+            return
+        loop = asyncio.get_running_loop()
+        self._prefetch_frame_id = frame_id
+        self._prefetch_future = loop.run_in_executor(
+            self.executor, env._decode_frame, frame_id
+        )
+
+    def _cancel_prefetch(self):
+        if self._prefetch_future is not None:
+            self._prefetch_future.cancel()
+            self._prefetch_future = None
+        self.env.unwrapped._prefetched_frames.clear()
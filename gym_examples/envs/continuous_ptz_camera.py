@@ -0,0 +1,81 @@
+from .continuous_viewport import ContinuousViewportMixin
+from .ptz_camera import PtzCameraEnv
+
+
+class ContinuousPtzCameraEnv(ContinuousViewportMixin, PtzCameraEnv):
+    """
+    A PTZ camera env that pans and zooms smoothly instead of moving on the
+    grid. Each action is (x, y, zoom), see `ViewportResampler`; pixel
+    observations are always resampled to the size of the viewport at zoom 1.
+
+    The reward is the number of objects whose midpoint is inside the crop.
+    Observation modes that depend on a grid-aligned viewport are not
+    supported.
+    """
+
+    obs_modes = ["pixels", "heatmap", "occupancy", "none"]
+
+    def __init__(
+        self,
+        render_mode=None,
+        num_grid_x=9,
+        num_grid_y=5,
+        num_grid_viewport_x=5,
+        num_grid_viewport_y=3,
+        grid_size=50,
+        lane_width=25,
+        obj_margin=2,
+        obs_mode="pixels",
+        min_zoom=1.0,
+        max_zoom=4.0,
+        num_zoom_levels=64,
+    ):
+        super().__init__(
+            render_mode=render_mode,
+            num_grid_x=num_grid_x,
+            num_grid_y=num_grid_y,
+            num_grid_viewport_x=num_grid_viewport_x,
+            num_grid_viewport_y=num_grid_viewport_y,
+            grid_size=grid_size,
+            lane_width=lane_width,
+            obj_margin=obj_margin,
+            obs_mode=obs_mode,
+        )
+        self._init_continuous_viewport(
+            (num_grid_viewport_x * grid_size, num_grid_viewport_y * grid_size),
+            min_zoom,
+            max_zoom,
+            num_zoom_levels,
+        )
+
+    def _get_obs(self):
+        if self.obs_mode == "pixels":
+            return self.resampler.resample(
+                self._get_panoramic_obs_frame(), self.viewport_rect
+            )
+        return super()._get_obs()
+
+    def _get_info(self):
+        info = super()._get_info()
+        info["gt_objcnt"] = len(self.objects)
+        return info
+
+    def step(self, action):
+        self._move_viewport(action)
+        self._step_objects()
+
+        observation = self._get_obs()
+        reward = self._count_obj_in_rect(self.viewport_rect)
+        terminated = False
+        info = self._get_info()
+
+        if self.render_mode in ("human", "human_async"):
+            self._render_frame()
+
+        return observation, reward, terminated, False, info
+
+    def _count_obj_in_rect(self, rect):
+        x1, y1, w, h, _ = rect
+        return len(
+            [o for o in self.objects if self._is_inside(o, x1, x1 + w, y1, y1 + h)]
+        )
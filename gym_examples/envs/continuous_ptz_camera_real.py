@@ -0,0 +1,42 @@
+from .continuous_viewport import ContinuousViewportMixin
+from .ptz_camera_real import PtzCameraRealEnv
+
+
+class ContinuousPtzCameraRealEnv(ContinuousViewportMixin, PtzCameraRealEnv):
+    """
+    A PTZ camera env over real footage that pans and zooms smoothly instead of
+    moving on the grid. Each action is (x, y, zoom), see `ViewportResampler`;
+    observations are always resampled to the size of the viewport at zoom 1.
+    """
+
+    obs_modes = ["pixels"]
+
+    def __init__(
+        self,
+        frames_dir,
+        render_mode=None,
+        num_grid_x=9,
+        num_grid_y=5,
+        num_grid_viewport_x=5,
+        num_grid_viewport_y=3,
+        min_zoom=1.0,
+        max_zoom=4.0,
+        num_zoom_levels=64,
+    ):
+        super().__init__(
+            frames_dir,
+            render_mode=render_mode,
+            num_grid_x=num_grid_x,
+            num_grid_y=num_grid_y,
+            num_grid_viewport_x=num_grid_viewport_x,
+            num_grid_viewport_y=num_grid_viewport_y,
+        )
+        self._init_continuous_viewport(
+            (self.viewport_size_x, self.viewport_size_y),
+            min_zoom,
+            max_zoom,
+            num_zoom_levels,
+        )
+
+    def _get_obs(self):
+        return self.resampler.resample(self.img, self.viewport_rect)
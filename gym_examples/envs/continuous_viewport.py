@@ -0,0 +1,48 @@
+import numpy as np
+from gymnasium import spaces
+
+from gym_examples.utils.resampler import ViewportResampler
+
+
+class ContinuousViewportMixin:
+    """
+    Smooth pan and zoom for a PTZ camera env, mixed in before the env class.
+    Each action is (x, y, zoom), see `ViewportResampler`, and the viewport is
+    `self.viewport_rect` as returned by `ViewportResampler.get_rect()`.
+    """
+
+    def _init_continuous_viewport(
+        self, viewport_wh, min_zoom, max_zoom, num_zoom_levels
+    ):
+        self.resampler = ViewportResampler(
+            self.get_panoramic_wh(),
+            viewport_wh,
+            min_zoom=min_zoom,
+            max_zoom=max_zoom,
+            num_zoom_levels=num_zoom_levels,
+        )
+        self.action_space = spaces.Box(
+            low=np.array([0, 0, min_zoom], dtype=np.float32),
+            high=np.array([1, 1, max_zoom], dtype=np.float32),
+            dtype=np.float32,
+        )
+
+    def _get_info(self):
+        return {
+            "vp": self.viewport_rect[:4],
+        }
+
+    def reset(self, seed=None, options=None):
+        # Centered, zoomed out as far as allowed
+        self.viewport_rect = self.resampler.get_rect(0.5, 0.5, self.resampler.zooms[0])
+        return super().reset(seed=seed, options=options)
+
+    def _move_viewport(self, action):
+        self.viewport_rect = self.resampler.get_rect(action[0], action[1], action[2])
+
+    def _draw_viewport_box_onto_canvas(self, canvas):
+        import pygame
+
+        x, y, w, h, _ = self.viewport_rect
+        pygame.draw.rect(canvas, (0, 0, 255), pygame.Rect(x, y, w, h), width=4)
+        return canvas
@@ -1,15 +1,22 @@
 import gymnasium as gym
 from gymnasium import spaces
-import pygame
 import numpy as np
 
 
 class GridWorldEnv(gym.Env):
+    """
+    With `tabular=True`, the agent and the target are tracked as state ids
+    (`x * size + y`) and each step is a lookup into the precomputed
+    `transitions` table. The tables are available in both modes, for
+    dynamic programming solvers and for `step_batch()`.
+    """
+
     metadata = {"render_modes": ["human", "rgb_array"], "render_fps": 4}
 
-    def __init__(self, render_mode=None, size=5):
+    def __init__(self, render_mode=None, size=5, tabular=False):
         self.size = size  # The size of the square grid
         self.window_size = 512  # The size of the PyGame window
+        self.tabular = tabular
 
         # Observations are dictionaries with the agent's and the target's location.
         # Each location is encoded as an element of {0, ..., `size`}^2, i.e. MultiDiscrete([size, size]).
@@ -35,6 +42,21 @@ class GridWorldEnv(gym.Env):
             3: np.array([0, -1]),
         }
 
+        """
+        `self.transitions[s, a]` is the state reached by taking action `a` in
+        state `s`, and `self._state_to_location[s]` is the location of state `s`.
+        """
+        self.num_states = size * size
+        self._state_to_location = np.stack(
+            np.divmod(np.arange(self.num_states), size), axis=1
+        )
+        self._state_to_location.flags.writeable = False
+        directions = np.array([self._action_to_direction[a] for a in range(4)])
+        next_locations = np.clip(
+            self._state_to_location[:, None, :] + directions[None, :, :], 0, size - 1
+        )
+        self.transitions = next_locations[..., 0] * size + next_locations[..., 1]
+
         assert render_mode is None or render_mode in self.metadata["render_modes"]
         self.render_mode = render_mode
 
@@ -52,6 +74,12 @@ class GridWorldEnv(gym.Env):
         return {"agent": self._agent_location, "target": self._target_location}
 
     def _get_info(self):
+        if self.tabular:
+            agent_x, agent_y = divmod(self._agent_state, self.size)
+            target_x, target_y = divmod(self._target_state, self.size)
+            return {
+                "distance": float(abs(agent_x - target_x) + abs(agent_y - target_y))
+            }
         return {
             "distance": np.linalg.norm(
                 self._agent_location - self._target_location, ord=1
@@ -72,6 +100,10 @@ class GridWorldEnv(gym.Env):
                 0, self.size, size=2, dtype=int
             )
 
+        if self.tabular:
+            self._agent_state = self._location_to_state(self._agent_location)
+            self._target_state = self._location_to_state(self._target_location)
+
         observation = self._get_obs()
         info = self._get_info()
 
@@ -81,6 +113,9 @@ class GridWorldEnv(gym.Env):
         return observation, info
 
     def step(self, action):
+        if self.tabular:
+            return self._step_tabular(action)
+
         # Map the action (element of {0,1,2,3}) to the direction we walk in
         direction = self._action_to_direction[action]
         # We use `np.clip` to make sure we don't leave the grid
@@ -98,11 +133,49 @@ class GridWorldEnv(gym.Env):
 
         return observation, reward, terminated, False, info
 
+    def _step_tabular(self, action):
+        self._agent_state = int(self.transitions[self._agent_state, action])
+        # Copy, so that observations do not alias the read-only table
+        self._agent_location = self._state_to_location[self._agent_state].copy()
+        terminated = self._agent_state == self._target_state
+        reward = 1 if terminated else 0
+        observation = self._get_obs()
+        info = self._get_info()
+
+        if self.render_mode == "human":
+            self._render_frame()
+
+        return observation, reward, terminated, False, info
+
+    def _location_to_state(self, location):
+        return int(location[0]) * self.size + int(location[1])
+
+    def get_reward_table(self, target_state):
+        """
+        `R[s, a]`, the reward of taking action `a` in state `s` when the target
+        is at `target_state`. Together with `self.transitions` this fully
+        describes the MDP, with `target_state` as the only terminal state.
+        """
+        return (self.transitions == target_state).astype(np.float64)
+
+    def step_batch(self, agent_states, actions, target_states):
+        """
+        Steps N independent agents at once, without touching the state of the
+        env. All arguments are integer arrays of shape (N,).
+
+        Returns the next states, the rewards and the terminated flags.
+        """
+        next_states = self.transitions[agent_states, actions]
+        terminated = next_states == target_states
+        return next_states, terminated.astype(np.int64), terminated
+
     def render(self):
         if self.render_mode == "rgb_array":
             return self._render_frame()
 
     def _render_frame(self):
+        import pygame
+
         if self.window is None and self.render_mode == "human":
             pygame.init()
             pygame.display.init()
@@ -166,5 +239,7 @@ class GridWorldEnv(gym.Env):
 
     def close(self):
         if self.window is not None:
+            import pygame
+
             pygame.display.quit()
             pygame.quit()
@@ -0,0 +1,99 @@
+import numpy as np
+from gymnasium import spaces
+
+from gym_examples.utils.oracle_index import motion_energy
+from .ptz_camera_real import PtzCameraRealEnv
+
+
+class MultiPtzCameraRealEnv(PtzCameraRealEnv):
+    """
+    `num_cameras` PTZ cameras looking at the same panorama. Each camera moves
+    one step at a time like in `PtzCameraRealEnv`, and all cameras step over
+    the same frame, which is decoded once per time step.
+
+    The action is one direction per camera, the observation stacks the
+    viewports of all cameras along the first axis, and the reward has one
+    entry per camera: the score of its viewport.
+
+    `score_fn(view, prev_view)`: scores one viewport crop, with the same
+    signature as in `gym_examples.utils.oracle_index`. `prev_view` is the
+    same viewport in the previous frame. Defaults to `motion_energy`.
+
+    `initial_vps`: the (x, y) grid of the upper-left corner of each viewport
+    after reset. By default the viewports are spread evenly along the x axis.
+    """
+
+    def __init__(
+        self,
+        frames_dir,
+        num_cameras=2,
+        initial_vps=None,
+        score_fn=motion_energy,
+        render_mode=None,
+        num_grid_x=9,
+        num_grid_y=5,
+        num_grid_viewport_x=5,
+        num_grid_viewport_y=3,
+    ):
+        super().__init__(
+            frames_dir,
+            render_mode=render_mode,
+            num_grid_x=num_grid_x,
+            num_grid_y=num_grid_y,
+            num_grid_viewport_x=num_grid_viewport_x,
+            num_grid_viewport_y=num_grid_viewport_y,
+        )
+        self.num_cameras = num_cameras
+        if initial_vps is None:
+            xs = np.linspace(0, num_grid_x - num_grid_viewport_x, num_cameras)
+            y = int((num_grid_y - num_grid_viewport_y) / 2)
+            initial_vps = [(int(round(x)), y) for x in xs]
+        assert len(initial_vps) == num_cameras
+        self.initial_vps = [tuple(vp) for vp in initial_vps]
+        self.score_fn = score_fn
+
+        self.observation_space = spaces.Box(
+            low=0,
+            high=255,
+            shape=(num_cameras, self.viewport_size_y, self.viewport_size_x, 3),
+            dtype=np.uint8,
+        )
+        self.action_space = spaces.MultiDiscrete([5] * num_cameras)
+
+    def _get_obs(self):
+        obs = np.empty(self.observation_space.shape, dtype=np.uint8)
+        for i, vp in enumerate(self.viewport_grid_locs):
+            obs[i] = self.get_view_of_viewport(vp)
+        return obs
+
+    def _get_info(self):
+        return {
+            "vps": list(self.viewport_grid_locs),
+        }
+
+    def reset(self, seed=None, options=None):
+        self.viewport_grid_locs = list(self.initial_vps)
+        return super().reset(seed=seed, options=options)
+
+    def step(self, action):
+        prev_img = self.img
+        observation, _, terminated, truncated, info = super().step(action)
+        reward = np.array(
+            [
+                self.score_fn(
+                    self._crop_viewport(self.img, vp), self._crop_viewport(prev_img, vp)
+                )
+                for vp in self.viewport_grid_locs
+            ]
+        )
+        return observation, reward, terminated, truncated, info
+
+    def _move_viewport(self, action):
+        self.viewport_grid_locs = [
+            self._get_moved_vp(vp, a) for vp, a in zip(self.viewport_grid_locs, action)
+        ]
+
+    def _draw_viewport_box_onto_canvas(self, canvas):
+        for vp in self.viewport_grid_locs:
+            self._draw_box_of_vp_onto_canvas(canvas, vp)
+        return canvas
@@ -1,6 +1,5 @@
 import gymnasium as gym
 import numpy as np
-import pygame
 from gymnasium import spaces
 
 
@@ -12,13 +11,34 @@ class SquareObj():
         self.loc_y = loc_y
         self.size = size
         self.vel_x = vel_x
+        # (row, col) of the grid containing the midpoint, or None if the
+        # midpoint is outside the frame. Maintained by the env.
+        self.grid = None
 
     def get_midpoint(self):
         return (self.loc_x + 0.5 * self.size, self.loc_y + 0.5 * self.size)
 
 
 class PtzCameraEnv(gym.Env):
-    metadata = {"render_modes": ["human", "rgb_array"], "render_fps": 4}
+    """
+    `obs_mode` selects what the agent observes:
+    - "pixels": RGB crop of the viewport (default).
+    - "heatmap": per-grid object counts of the whole frame, shape
+      (num_grid_y, num_grid_x).
+    - "boxes": (x, y, w, h) of every object inside the viewport, relative to
+      the upper-left corner of the viewport.
+    - "occupancy": per-grid object counts and mean x-velocities of the
+      whole frame, shape (num_grid_y, num_grid_x, 2).
+    - "occupancy_viewport": same as "occupancy", restricted to the viewport,
+      shape (num_grid_viewport_y, num_grid_viewport_x, 2).
+    - "none": an empty array. Only reward and info are meaningful.
+    Only "pixels" needs to rasterize the scene. The per-grid statistics are
+    updated incrementally as objects move, spawn and get GC'd.
+    """
+    metadata = {"render_modes": ["human", "human_async", "rgb_array"], "render_fps": 4}
+    obs_modes = [
+        "pixels", "heatmap", "boxes", "occupancy", "occupancy_viewport", "none",
+    ]
 
     def __init__(self, render_mode=None,
                  num_grid_x=9,
@@ -27,7 +47,8 @@ class PtzCameraEnv(gym.Env):
                  num_grid_viewport_y=3,
                  grid_size=50,
                  lane_width=25,
-                 obj_margin=2):
+                 obj_margin=2,
+                 obs_mode="pixels"):
         # The size of the square grid
         self.num_grid_x = num_grid_x
         self.num_grid_y = num_grid_y
@@ -49,16 +70,17 @@ class PtzCameraEnv(gym.Env):
 
         self.obj_size = lane_width - obj_margin * 2
 
-        self.observation_space = spaces.Box(
-            low=0,
-            high=255,
-            shape=np.array([self.num_grid_viewport_y * self.grid_size,
-                           self.num_grid_viewport_x * self.grid_size,
-                           3]),
-            dtype=np.uint8)
+        assert obs_mode in self.obs_modes
+        self.obs_mode = obs_mode
+        self.observation_space = self._make_observation_space()
 
         self.objects = []
         self.vp_2_objcnt = {}
+        self._init_grid_stats()
+        # Surface that pixel observations are drawn onto, created on first use
+        self._obs_canvas = None
+        # Reused by `_render_frame()` for every rendered frame
+        self._render_canvas = None
 
         # "no-op", "right", "up", "left", "down"
         self.action_space = spaces.Discrete(5)
@@ -83,25 +105,148 @@ class PtzCameraEnv(gym.Env):
         """
         self.window = None
         self.clock = None
+        # With "human_async", a `SharedMemoryViewer` that displays the frames
+        # in another process, so that stepping is not throttled to render_fps.
+        self.viewer = None
+
+    def _make_observation_space(self):
+        if self.obs_mode == "pixels":
+            return spaces.Box(
+                low=0,
+                high=255,
+                shape=np.array([self.num_grid_viewport_y * self.grid_size,
+                               self.num_grid_viewport_x * self.grid_size,
+                               3]),
+                dtype=np.uint8)
+        elif self.obs_mode == "heatmap":
+            return spaces.Box(
+                low=0,
+                high=np.iinfo(np.int32).max,
+                shape=(self.num_grid_y, self.num_grid_x),
+                dtype=np.int32)
+        elif self.obs_mode == "boxes":
+            return spaces.Sequence(
+                spaces.Box(low=-np.inf, high=np.inf, shape=(4,), dtype=np.float32),
+                stack=True)
+        elif self.obs_mode in ("occupancy", "occupancy_viewport"):
+            if self.obs_mode == "occupancy":
+                shape = (self.num_grid_y, self.num_grid_x, 2)
+            else:
+                shape = (self.num_grid_viewport_y, self.num_grid_viewport_x, 2)
+            # Channel 0 is the object count, channel 1 the mean x-velocity
+            low = np.full(shape, -np.inf, dtype=np.float32)
+            low[..., 0] = 0
+            return spaces.Box(
+                low=low,
+                high=np.full(shape, np.inf, dtype=np.float32),
+                dtype=np.float32)
+        else:  # none
+            return spaces.Box(low=0, high=0, shape=(0,), dtype=np.uint8)
 
     def _get_obs(self):
-        return self.get_view_of_viewport(self.viewport_grid_loc)
+        if self.obs_mode == "pixels":
+            return self.get_view_of_viewport(self.viewport_grid_loc)
+        elif self.obs_mode == "heatmap":
+            return self.get_obj_heatmap()
+        elif self.obs_mode == "boxes":
+            return self.get_obj_boxes_in_viewport(self.viewport_grid_loc)
+        elif self.obs_mode == "occupancy":
+            return self.get_occupancy()
+        elif self.obs_mode == "occupancy_viewport":
+            return self.get_occupancy(self.viewport_grid_loc)
+        else:  # none
+            return np.zeros(0, dtype=np.uint8)
+
+    def get_obj_heatmap(self):
+        """
+        Number of objects in each grid of the whole frame. An object belongs to
+        the grid containing its midpoint, same as in `_count_obj_in_vp()`.
+        """
+        return self._grid_objcnt.copy()
+
+    def get_occupancy(self, vp=None):
+        """
+        Per-grid object counts and mean x-velocities, stacked along the last
+        axis. Covers the whole frame, or only viewport `vp` if given.
+        """
+        cnt = self._grid_objcnt
+        vel_sum = self._grid_vel_sum
+        if vp is not None:
+            x, y = vp
+            cnt = cnt[y: y + self.num_grid_viewport_y,
+                      x: x + self.num_grid_viewport_x]
+            vel_sum = vel_sum[y: y + self.num_grid_viewport_y,
+                              x: x + self.num_grid_viewport_x]
+        occupancy = np.zeros(cnt.shape + (2,), dtype=np.float32)
+        occupancy[..., 0] = cnt
+        np.divide(vel_sum, cnt, out=occupancy[..., 1], where=cnt > 0)
+        return occupancy
+
+    def _init_grid_stats(self):
+        self._grid_objcnt = np.zeros((self.num_grid_y, self.num_grid_x), dtype=np.int32)
+        self._grid_vel_sum = np.zeros((self.num_grid_y, self.num_grid_x), dtype=np.float64)
+
+    def _get_grid_of(self, o):
+        x, y = o.get_midpoint()
+        if x >= 0 and x < self.size_x and y >= 0 and y < self.size_y:
+            return (int(y // self.grid_size), int(x // self.grid_size))
+        return None
+
+    def _add_to_grid_stats(self, o):
+        o.grid = self._get_grid_of(o)
+        if o.grid is not None:
+            self._grid_objcnt[o.grid] += 1
+            self._grid_vel_sum[o.grid] += o.vel_x
+
+    def _remove_from_grid_stats(self, o):
+        if o.grid is not None:
+            self._grid_objcnt[o.grid] -= 1
+            if self._grid_objcnt[o.grid] == 0:
+                # Do not let floating point errors accumulate
+                self._grid_vel_sum[o.grid] = 0
+            else:
+                self._grid_vel_sum[o.grid] -= o.vel_x
+            o.grid = None
+
+    def get_obj_boxes_in_viewport(self, vp):
+        x1 = vp[0] * self.grid_size
+        x2 = (vp[0] + self.num_grid_viewport_x) * self.grid_size
+        y1 = vp[1] * self.grid_size
+        y2 = (vp[1] + self.num_grid_viewport_y) * self.grid_size
+
+        boxes = [(o.loc_x - x1, o.loc_y - y1, o.size, o.size)
+                 for o in self.objects
+                 if self._is_inside(o, x1, x2, y1, y2)]
+        return np.array(boxes, dtype=np.float32).reshape(-1, 4)
 
     def get_view_of_viewport(self, vp):
         """
         Can be used by the oracle to cheat by looking outside the viewport.
         """
-        canvas = self._init_canvas_with_frame_content(gridlines=False)
-        frame = np.transpose(
-            pygame.surfarray.pixels3d(canvas), axes=(1, 0, 2)
-        )
+        frame = self._get_panoramic_obs_frame()
 
         # Crop out the viewport
         x = vp[0] * self.grid_size
         y = vp[1] * self.grid_size
         frame = frame[y: y + self.num_grid_viewport_y * self.grid_size,
                       x: x + self.num_grid_viewport_x * self.grid_size]
-        return frame
+        return frame.copy()
+
+    def _get_panoramic_obs_frame(self):
+        """
+        The whole frame as seen by the agent, i.e. without gridlines. The
+        returned array is a view of a canvas that is reused across calls, so
+        the caller must copy out what it keeps.
+        """
+        import pygame
+
+        if self._obs_canvas is None:
+            self._obs_canvas = pygame.Surface((self.size_x, self.size_y))
+        canvas = self._init_canvas_with_frame_content(
+            gridlines=False, canvas=self._obs_canvas)
+        return np.transpose(
+            pygame.surfarray.pixels3d(canvas), axes=(1, 0, 2)
+        )
 
     def _get_info(self):
         return {
@@ -127,7 +272,7 @@ class PtzCameraEnv(gym.Env):
         observation = self._get_obs()
         info = self._get_info()
 
-        if self.render_mode == "human":
+        if self.render_mode in ("human", "human_async"):
             self._render_frame()
 
         return observation, info
@@ -143,7 +288,7 @@ class PtzCameraEnv(gym.Env):
         terminated = False
         info = self._get_info()
 
-        if self.render_mode == "human":
+        if self.render_mode in ("human", "human_async"):
             self._render_frame()
 
         return observation, reward, terminated, False, info
@@ -154,17 +299,28 @@ class PtzCameraEnv(gym.Env):
         self._spawn_objects()
 
     def _move_viewport(self, action):
-        direction = self._action_to_direction[action]
-        self.viewport_grid_loc = np.array(self.viewport_grid_loc) + direction
+        # Plain ints, to not allocate numpy arrays on every step
+        dx, dy = self._action_to_direction[action]
+        x, y = self.viewport_grid_loc
         self.viewport_grid_loc = (
-            np.clip(self.viewport_grid_loc[0], 0, self.num_grid_x - self.num_grid_viewport_x),
-            np.clip(self.viewport_grid_loc[1], 0, self.num_grid_y - self.num_grid_viewport_y),
+            min(max(int(x + dx), 0), self.num_grid_x - self.num_grid_viewport_x),
+            min(max(int(y + dy), 0), self.num_grid_y - self.num_grid_viewport_y),
         )
 
     def _count_obj_in_all_viewports(self):
+        # An object is inside a viewport iff the grid containing its midpoint
+        # is, so sum the per-grid counts with an integral image.
+        integral = np.zeros((self.num_grid_y + 1, self.num_grid_x + 1), dtype=np.int64)
+        np.cumsum(self._grid_objcnt, axis=0, out=integral[1:, 1:])
+        np.cumsum(integral[1:, 1:], axis=1, out=integral[1:, 1:])
+        w = self.num_grid_viewport_x
+        h = self.num_grid_viewport_y
+
         ret = {}
         for vp in self.get_all_vps():
-            ret[vp] = self._count_obj_in_vp(vp)
+            x, y = vp
+            ret[vp] = int(integral[y + h, x + w] - integral[y, x + w]
+                          - integral[y + h, x] + integral[y, x])
         return ret
 
     def get_panoramic_wh(self):
@@ -226,6 +382,9 @@ class PtzCameraEnv(gym.Env):
     def _move_objects(self):
         for o in self.objects:
             o.loc_x += o.vel_x
+            if self._get_grid_of(o) != o.grid:
+                self._remove_from_grid_stats(o)
+                self._add_to_grid_stats(o)
 
     def _gc_objects(self):
         def is_out(o):
@@ -233,8 +392,11 @@ class PtzCameraEnv(gym.Env):
                 return o.loc_x >= self.size_x
             else:
                 return o.loc_x + o.size <= 0
-        self.objects = [o for o in self.objects
-                        if not is_out(o)]
+        # Remove in place, backwards to keep the order of the remaining objects
+        for i in range(len(self.objects) - 1, -1, -1):
+            if is_out(self.objects[i]):
+                self._remove_from_grid_stats(self.objects[i])
+                del self.objects[i]
 
     def _spawn_objects(self):
         num_lanes = int(self.size_y / self.lane_width)
@@ -254,11 +416,14 @@ class PtzCameraEnv(gym.Env):
                 vel_x = -1 * self._get_initial_vel()
             o = SquareObj(loc_x, loc_y, self.obj_size, vel_x)
             self.objects.append(o)
+            self._add_to_grid_stats(o)
 
     def _get_initial_vel(self):
         return self.np_random.normal(loc=10, scale=1)
 
     def _render_frame(self):
+        import pygame
+
         window_size = (self.size_x, self.size_y)
 
         if self.window is None and self.render_mode == "human":
@@ -267,8 +432,15 @@ class PtzCameraEnv(gym.Env):
             self.window = pygame.display.set_mode(window_size)
         if self.clock is None and self.render_mode == "human":
             self.clock = pygame.time.Clock()
+        if self.viewer is None and self.render_mode == "human_async":
+            from gym_examples.utils.viewer import SharedMemoryViewer
+
+            self.viewer = SharedMemoryViewer(window_size)
 
-        canvas = self._init_canvas_with_frame_content(gridlines=True)
+        if self._render_canvas is None:
+            self._render_canvas = pygame.Surface(window_size)
+        canvas = self._init_canvas_with_frame_content(
+            gridlines=True, canvas=self._render_canvas)
         canvas = self._draw_viewport_box_onto_canvas(canvas)
 
         if self.render_mode == "human":
@@ -280,15 +452,21 @@ class PtzCameraEnv(gym.Env):
             # We need to ensure that human-rendering occurs at the predefined framerate.
             # The following line will automatically add a delay to keep the framerate stable.
             self.clock.tick(self.metadata["render_fps"])
+        elif self.render_mode == "human_async":
+            self.viewer.publish(pygame.surfarray.pixels3d(canvas))
         else:  # rgb_array
+            # Copy out, since the canvas is overwritten by the next render
             return np.transpose(
                 pygame.surfarray.pixels3d(canvas), axes=(1, 0, 2)
-            )
+            ).copy()
+
+    def _init_canvas_with_frame_content(self, gridlines: bool, canvas=None):
+        import pygame
 
-    def _init_canvas_with_frame_content(self, gridlines: bool):
         window_size = (self.size_x, self.size_y)
 
-        canvas = pygame.Surface(window_size)
+        if canvas is None:
+            canvas = pygame.Surface(window_size)
         canvas.fill((255, 255, 255))
 
         # Draw objects
@@ -324,6 +502,8 @@ class PtzCameraEnv(gym.Env):
         Draw a bounding box corresponding to the viewport. Only to be used for
         human visualization, not used for agent observation.
         """
+        import pygame
+
         x = self.viewport_grid_loc[0] * self.grid_size
         y = self.viewport_grid_loc[1] * self.grid_size
         w = self.num_grid_viewport_x * self.grid_size
@@ -347,6 +527,11 @@ class PtzCameraEnv(gym.Env):
         return canvas
 
     def close(self):
+        if self.viewer is not None:
+            self.viewer.close()
+            self.viewer = None
         if self.window is not None:
+            import pygame
+
             pygame.display.quit()
             pygame.quit()
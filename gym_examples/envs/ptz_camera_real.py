@@ -1,12 +1,31 @@
 import gymnasium as gym
 import numpy as np
-import pygame
 from gymnasium import spaces
 from PIL import Image
 
 
 class PtzCameraRealEnv(gym.Env):
-    metadata = {"render_modes": ["human", "rgb_array"], "render_fps": 4}
+    """
+    `obs_mode` selects what the agent observes:
+    - "pixels": RGB crop of the viewport (default).
+    - "ref": (frame_id, vp_x, vp_y), which together with the footage on disk
+      fully determines the "pixels" observation. See
+      `gym_examples.utils.FrameStore` to materialize the pixels.
+
+    By default each reset continues from the frame after the last one played.
+    `reset(options={"start_frame": ..., "length": ...})` instead plays the
+    window of `length` frames starting at `start_frame`, and the episode is
+    truncated at the end of the window. Both keys are optional. `start_frame`
+    must be a frame id of the footage, and `length` must be at least 2 since
+    reset already plays the first frame. See
+    `gym_examples.utils.EpisodeWindowSampler` to draw windows.
+    """
+
+    metadata = {
+        "render_modes": ["human", "human_async", "rgb_array"],
+        "render_fps": 4,
+    }
+    obs_modes = ["pixels", "ref"]
 
     def __init__(
         self,
@@ -16,6 +35,7 @@ class PtzCameraRealEnv(gym.Env):
         num_grid_y=5,
         num_grid_viewport_x=5,
         num_grid_viewport_y=3,
+        obs_mode="pixels",
     ):
         self.frames = sorted(frames_dir.glob("*.png"))
         self.num_grid_x = num_grid_x
@@ -34,12 +54,9 @@ class PtzCameraRealEnv(gym.Env):
         self.viewport_size_x = num_grid_viewport_x * self.grid_size_x
         self.viewport_size_y = num_grid_viewport_y * self.grid_size_y
 
-        self.observation_space = spaces.Box(
-            low=0,
-            high=255,
-            shape=np.array([self.viewport_size_y, self.viewport_size_x, 3]),
-            dtype=np.uint8,
-        )
+        assert obs_mode in self.obs_modes
+        self.obs_mode = obs_mode
+        self.observation_space = self._make_observation_space()
 
         # "no-op", "right", "up", "left", "down"
         self.action_space = spaces.Discrete(5)
@@ -52,6 +69,12 @@ class PtzCameraRealEnv(gym.Env):
             4: np.array([0, 0]),
         }
         self.frame_id = 0
+        # Last frame of the current episode window, inclusive. None if the
+        # episode runs until the end of the footage.
+        self.episode_end_frame_id = None
+        # Frames decoded ahead of time, keyed by frame id. See
+        # `AsyncPtzCameraRealEnv`.
+        self._prefetched_frames = {}
 
         assert render_mode is None or render_mode in self.metadata["render_modes"]
         self.render_mode = render_mode
@@ -64,23 +87,55 @@ class PtzCameraRealEnv(gym.Env):
         """
         self.window = None
         self.clock = None
+        # With "human_async", a `SharedMemoryViewer` that displays the frames
+        # in another process, so that stepping is not throttled to render_fps.
+        self.viewer = None
+        # Reused by `_render_frame()` for every rendered frame
+        self._render_canvas = None
+
+    def _make_observation_space(self):
+        if self.obs_mode == "pixels":
+            return spaces.Box(
+                low=0,
+                high=255,
+                shape=np.array([self.viewport_size_y, self.viewport_size_x, 3]),
+                dtype=np.uint8,
+            )
+        else:  # ref
+            return spaces.Box(
+                low=0,
+                high=np.array(
+                    [
+                        len(self.frames) - 1,
+                        self.num_grid_x - self.num_grid_viewport_x,
+                        self.num_grid_y - self.num_grid_viewport_y,
+                    ]
+                ),
+                dtype=np.int64,
+            )
 
     def _get_obs(self):
-        return self.get_view_of_viewport(self.viewport_grid_loc)
+        if self.obs_mode == "pixels":
+            return self.get_view_of_viewport(self.viewport_grid_loc)
+        else:  # ref
+            return np.array(
+                [self.frame_id, self.viewport_grid_loc[0], self.viewport_grid_loc[1]],
+                dtype=np.int64,
+            )
 
     def get_view_of_viewport(self, vp):
         """
         Can be used by the oracle to cheat by looking outside the viewport.
         """
+        return self._crop_viewport(self.img, vp)
 
-        # Crop out the viewport
+    def _crop_viewport(self, img, vp):
         x = vp[0] * self.grid_size_x
         y = vp[1] * self.grid_size_y
-        img = self.img[
+        return img[
             y : y + self.num_grid_viewport_y * self.grid_size_y,
             x : x + self.num_grid_viewport_x * self.grid_size_x,
         ]
-        return img
 
     def get_panoramic_view(self):
         return self.img
@@ -94,6 +149,19 @@ class PtzCameraRealEnv(gym.Env):
         # We need the following line to seed self.np_random
         super().reset(seed=seed)
 
+        options = options or {}
+        if "start_frame" in options:
+            first, last = self._get_frame_id_range()
+            assert (
+                first <= options["start_frame"] <= last
+            ), f"start_frame must be in [{first}, {last}]"
+            self.frame_id = options["start_frame"]
+        if options.get("length") is not None:
+            assert options["length"] >= 2, "An episode needs at least one step"
+            self.episode_end_frame_id = self.frame_id + options["length"] - 1
+        else:
+            self.episode_end_frame_id = None
+
         # The grid id for the upper-right corner of the viewport
         self.viewport_grid_loc = (
             int((self.num_grid_x - self.num_grid_viewport_x) / 2),
@@ -104,7 +172,7 @@ class PtzCameraRealEnv(gym.Env):
         observation = self._get_obs()
         info = self._get_info()
 
-        if self.render_mode == "human":
+        if self.render_mode in ("human", "human_async"):
             self._render_frame()
 
         self.frame_id += 1
@@ -116,29 +184,48 @@ class PtzCameraRealEnv(gym.Env):
 
         observation = self._get_obs()
         reward = 0  # TODO
-        terminated = self.frame_id == len(self.frames) - 1
+        terminated = self._is_last_frame()
+        truncated = (
+            not terminated
+            and self.episode_end_frame_id is not None
+            and self.frame_id >= self.episode_end_frame_id
+        )
         info = self._get_info()
 
-        if self.render_mode == "human":
+        if self.render_mode in ("human", "human_async"):
             self._render_frame()
 
         self.frame_id += 1
-        return observation, reward, terminated, False, info
+        return observation, reward, terminated, truncated, info
+
+    def _is_last_frame(self):
+        return self.frame_id == len(self.frames) - 1
+
+    def _get_frame_id_range(self):
+        """
+        First and last frame ids that can be played, both inclusive.
+        """
+        return 0, len(self.frames) - 1
 
     def _load_img(self):
-        img_path = self.frames[self.frame_id]
-        self.img = np.array(Image.open(str(img_path)))
+        img = self._prefetched_frames.pop(self.frame_id, None)
+        if img is None:
+            img = self._decode_frame(self.frame_id)
+        self.img = img
+
+    def _decode_frame(self, frame_id):
+        img_path = self.frames[frame_id]
+        return np.array(Image.open(str(img_path)))
 
     def _move_viewport(self, action):
+        self.viewport_grid_loc = self._get_moved_vp(self.viewport_grid_loc, action)
+
+    def _get_moved_vp(self, vp, action):
         direction = self._action_to_direction[action]
-        self.viewport_grid_loc = np.array(self.viewport_grid_loc) + direction
-        self.viewport_grid_loc = (
-            np.clip(
-                self.viewport_grid_loc[0], 0, self.num_grid_x - self.num_grid_viewport_x
-            ),
-            np.clip(
-                self.viewport_grid_loc[1], 0, self.num_grid_y - self.num_grid_viewport_y
-            ),
+        vp = np.array(vp) + direction
+        return (
+            np.clip(vp[0], 0, self.num_grid_x - self.num_grid_viewport_x),
+            np.clip(vp[1], 0, self.num_grid_y - self.num_grid_viewport_y),
         )
 
     def render(self):
@@ -146,6 +233,8 @@ class PtzCameraRealEnv(gym.Env):
             return self._render_frame()
 
     def _render_frame(self):
+        import pygame
+
         window_size = (self.img_w, self.img_h)
 
         if self.window is None and self.render_mode == "human":
@@ -154,8 +243,15 @@ class PtzCameraRealEnv(gym.Env):
             self.window = pygame.display.set_mode(window_size)
         if self.clock is None and self.render_mode == "human":
             self.clock = pygame.time.Clock()
+        if self.viewer is None and self.render_mode == "human_async":
+            from gym_examples.utils.viewer import SharedMemoryViewer
+
+            self.viewer = SharedMemoryViewer(window_size)
 
-        canvas = pygame.surfarray.make_surface(np.transpose(self.img, (1, 0, 2)))
+        if self._render_canvas is None:
+            self._render_canvas = pygame.Surface(window_size)
+        canvas = self._render_canvas
+        pygame.surfarray.pixels3d(canvas)[...] = np.transpose(self.img, (1, 0, 2))
 
         self._draw_gridlines_onto_canvas(canvas)
         self._draw_viewport_box_onto_canvas(canvas)
@@ -169,10 +265,17 @@ class PtzCameraRealEnv(gym.Env):
             # We need to ensure that human-rendering occurs at the predefined framerate.
             # The following line will automatically add a delay to keep the framerate stable.
             self.clock.tick(self.metadata["render_fps"])
+        elif self.render_mode == "human_async":
+            self.viewer.publish(pygame.surfarray.pixels3d(canvas))
         else:  # rgb_array
-            return np.transpose(pygame.surfarray.pixels3d(canvas), axes=(1, 0, 2))
+            # Copy out, since the canvas is overwritten by the next render
+            return np.transpose(
+                pygame.surfarray.pixels3d(canvas), axes=(1, 0, 2)
+            ).copy()
 
     def _draw_gridlines_onto_canvas(self, canvas):
+        import pygame
+
         for i in range(self.num_grid_y):
             pygame.draw.line(
                 canvas,
@@ -195,8 +298,13 @@ class PtzCameraRealEnv(gym.Env):
         Draw a bounding box corresponding to the viewport. Only to be used for
         human visualization, not used for agent observation.
         """
-        x = self.viewport_grid_loc[0] * self.grid_size_x
-        y = self.viewport_grid_loc[1] * self.grid_size_y
+        return self._draw_box_of_vp_onto_canvas(canvas, self.viewport_grid_loc)
+
+    def _draw_box_of_vp_onto_canvas(self, canvas, vp):
+        import pygame
+
+        x = vp[0] * self.grid_size_x
+        y = vp[1] * self.grid_size_y
         w = self.num_grid_viewport_x * self.grid_size_x
         h = self.num_grid_viewport_y * self.grid_size_y
         lines = [
@@ -217,6 +325,16 @@ class PtzCameraRealEnv(gym.Env):
             )
         return canvas
 
+    def close(self):
+        if self.viewer is not None:
+            self.viewer.close()
+            self.viewer = None
+        if self.window is not None:
+            import pygame
+
+            pygame.display.quit()
+            pygame.quit()
+
     def get_panoramic_wh(self):
         return (self.img_w, self.img_h)
 
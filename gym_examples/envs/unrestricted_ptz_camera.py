@@ -1,5 +1,4 @@
 from .ptz_camera import PtzCameraEnv
-import numpy as np
 from gymnasium import spaces
 
 
@@ -14,6 +13,7 @@ class UnrestrictedPtzCameraEnv(PtzCameraEnv):
         grid_size=50,
         lane_width=25,
         obj_margin=2,
+        obs_mode="pixels",
     ):
         # The size of the square grid
         self.num_grid_x = num_grid_x
@@ -36,21 +36,15 @@ class UnrestrictedPtzCameraEnv(PtzCameraEnv):
 
         self.obj_size = lane_width - obj_margin * 2
 
-        self.observation_space = spaces.Box(
-            low=0,
-            high=255,
-            shape=np.array(
-                [
-                    self.num_grid_viewport_y * self.grid_size,
-                    self.num_grid_viewport_x * self.grid_size,
-                    3,
-                ]
-            ),
-            dtype=np.uint8,
-        )
+        assert obs_mode in self.obs_modes
+        self.obs_mode = obs_mode
+        self.observation_space = self._make_observation_space()
 
         self.objects = []
         self.vp_2_objcnt = {}
+        self._init_grid_stats()
+        self._obs_canvas = None
+        self._render_canvas = None
 
         self.action_space = spaces.MultiDiscrete(
             [self.num_grid_viewport_x, self.num_grid_viewport_y]
@@ -68,6 +62,8 @@ class UnrestrictedPtzCameraEnv(PtzCameraEnv):
         """
         self.window = None
         self.clock = None
+        self.viewer = None
 
     def _move_viewport(self, action):
-        self.viewport_grid_loc = (action[0], action[1])
+        # Plain ints, to not keep numpy scalars around on every step
+        self.viewport_grid_loc = (int(action[0]), int(action[1]))
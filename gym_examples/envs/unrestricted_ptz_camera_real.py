@@ -14,6 +14,10 @@ class UnrestrictedPtzCameraRealEnv(PtzCameraRealEnv):
 
     `start_frame_id`: inclusive.
     `end_frame_id`: inclusive.
+    `oracle_index_path`: optional .npy of per-viewport scores written by
+    `gym_examples.utils.oracle_index`. If given, `info` also contains
+    the best viewport of the frame ("oracle_vp") and the score difference
+    between it and the current viewport ("regret").
     """
 
     def __init__(
@@ -26,6 +30,8 @@ class UnrestrictedPtzCameraRealEnv(PtzCameraRealEnv):
         num_grid_y=5,
         num_grid_viewport_x=5,
         num_grid_viewport_y=3,
+        obs_mode="pixels",
+        oracle_index_path=None,
     ):
         self.frames = sorted(frames_dir.glob("*.png"))
         self.start_frame_id = start_frame_id
@@ -49,12 +55,9 @@ class UnrestrictedPtzCameraRealEnv(PtzCameraRealEnv):
         self.viewport_size_y = num_grid_viewport_y * self.grid_size_y
         logging.info(f'Grid size: x={self.grid_size_x}, y={self.grid_size_y}')
 
-        self.observation_space = spaces.Box(
-            low=0,
-            high=255,
-            shape=np.array([self.viewport_size_y, self.viewport_size_x, 3]),
-            dtype=np.uint8,
-        )
+        assert obs_mode in self.obs_modes
+        self.obs_mode = obs_mode
+        self.observation_space = self._make_observation_space()
 
         self.action_space = spaces.MultiDiscrete(
             [self.num_grid_viewport_x, self.num_grid_viewport_y]
@@ -71,23 +74,51 @@ class UnrestrictedPtzCameraRealEnv(PtzCameraRealEnv):
         """
         self.window = None
         self.clock = None
+        self.viewer = None
+        self._render_canvas = None
 
         self.frame_id = start_frame_id
+        self.episode_end_frame_id = None
+        self._prefetched_frames = {}
+
+        self.oracle_scores = None
+        if oracle_index_path is not None:
+            self._load_oracle_index(oracle_index_path)
+
+    def _load_oracle_index(self, oracle_index_path):
+        self.oracle_scores = np.load(str(oracle_index_path), mmap_mode="r")
+        assert self.oracle_scores.shape == (
+            len(self.frames),
+            self.num_grid_x - self.num_grid_viewport_x + 1,
+            self.num_grid_y - self.num_grid_viewport_y + 1,
+        )
+        # Reduce once up front so that each step is a lookup
+        scores = self.oracle_scores.reshape(len(self.frames), -1)
+        best = np.argmax(scores, axis=1)
+        self._oracle_best_scores = scores[np.arange(len(self.frames)), best]
+        self._oracle_vps = np.stack(
+            np.unravel_index(best, self.oracle_scores.shape[1:]), axis=1
+        )
 
-    def step(self, action):
-        self._load_img()
-        self._move_viewport(action)
-
-        observation = self._get_obs()
-        reward = 0  # TODO
-        terminated = (self.frame_id == self.end_frame_id)
-        info = self._get_info()
-
-        if self.render_mode == "human":
-            self._render_frame()
-
-        self.frame_id += 1
-        return observation, reward, terminated, False, info
+    def _get_info(self):
+        info = super()._get_info()
+        if self.oracle_scores is not None:
+            x, y = self.viewport_grid_loc
+            oracle_x, oracle_y = self._oracle_vps[self.frame_id]
+            info["oracle_vp"] = (int(oracle_x), int(oracle_y))
+            info["regret"] = float(
+                self._oracle_best_scores[self.frame_id]
+                - self.oracle_scores[self.frame_id, int(x), int(y)]
+            )
+        return info
+
+    def _is_last_frame(self):
+        return self.frame_id == self.end_frame_id
+
+    def _get_frame_id_range(self):
+        if self.end_frame_id is None:
+            return self.start_frame_id, len(self.frames) - 1
+        return self.start_frame_id, self.end_frame_id
 
     def get_start_frame_id(self):
         return self.start_frame_id
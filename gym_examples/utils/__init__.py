@@ -0,0 +1,16 @@
+from gym_examples.utils.frame_store import FrameStore
+from gym_examples.utils.replay_buffer import FrameRefReplayBuffer
+from gym_examples.utils.episode_windows import EpisodeWindowSampler
+from gym_examples.utils.viewer import SharedMemoryViewer
+from gym_examples.utils.episode_recorder import (
+    EpisodeRecorder,
+    NpzChunkSink,
+    VideoSink,
+)
+from gym_examples.utils.delta_codec import (
+    ObservationDecoder,
+    ObservationEncoder,
+    read_message,
+    write_message,
+)
+from gym_examples.utils.resampler import ViewportResampler
@@ -0,0 +1,132 @@
+import struct
+import zlib
+
+import numpy as np
+
+# flags, height, width, channels, tile_size, num_changed_tiles
+_HEADER = struct.Struct("<BHHHHI")
+_KEYFRAME = 1
+_LENGTH = struct.Struct("<I")
+
+
+class ObservationEncoder:
+    """
+    Encodes a stream of uint8 (h, w, c) observations into compact byte
+    messages for `ObservationDecoder`.
+
+    The observation is split into `tile_size` x `tile_size` tiles, and only
+    the tiles that changed since the previous observation are sent, XOR-ed
+    with their previous content so that small changes compress well. Every
+    `keyframe_interval`-th message, and any message after a change of shape,
+    is a keyframe carrying the whole observation.
+    """
+
+    def __init__(self, tile_size=16, keyframe_interval=100, compress_level=1):
+        self.tile_size = tile_size
+        self.keyframe_interval = keyframe_interval
+        self.compress_level = compress_level
+
+        self._prev = None
+        self._cur = None
+        self._num_encoded = 0
+
+    def encode(self, obs):
+        assert obs.dtype == np.uint8 and obs.ndim == 3
+        h, w, c = obs.shape
+        keyframe = (
+            self._prev is None
+            or self._shape != obs.shape
+            or self._num_encoded % self.keyframe_interval == 0
+        )
+        self._num_encoded += 1
+
+        if keyframe:
+            self._shape = obs.shape
+            self._prev = _alloc_padded(obs.shape, self.tile_size)
+            self._cur = np.zeros_like(self._prev)
+            self._prev[:h, :w] = obs
+            header = _HEADER.pack(_KEYFRAME, h, w, c, self.tile_size, 0)
+            payload = np.ascontiguousarray(obs).tobytes()
+            return header + zlib.compress(payload, self.compress_level)
+
+        self._cur[:h, :w] = obs
+        cur_tiles = _as_tiles(self._cur, self.tile_size)
+        prev_tiles = _as_tiles(self._prev, self.tile_size)
+        rows, cols = np.nonzero(np.any(cur_tiles != prev_tiles, axis=(2, 3, 4)))
+        residuals = cur_tiles[rows, cols] ^ prev_tiles[rows, cols]
+        changed = (rows * cur_tiles.shape[1] + cols).astype(np.uint32)
+
+        self._prev, self._cur = self._cur, self._prev
+        header = _HEADER.pack(0, h, w, c, self.tile_size, len(changed))
+        payload = changed.tobytes() + residuals.tobytes()
+        return header + zlib.compress(payload, self.compress_level)
+
+
+class ObservationDecoder:
+    """
+    Decodes the messages of an `ObservationEncoder`, which must be fed in
+    order, starting from a keyframe.
+    """
+
+    def __init__(self):
+        self._frame = None
+
+    def decode(self, message):
+        flags, h, w, c, tile_size, num_changed = _HEADER.unpack_from(message)
+        payload = zlib.decompress(message[_HEADER.size :])
+
+        if flags & _KEYFRAME:
+            self._frame = _alloc_padded((h, w, c), tile_size)
+            self._frame[:h, :w] = np.frombuffer(payload, dtype=np.uint8).reshape(
+                h, w, c
+            )
+            return self._frame[:h, :w].copy()
+
+        assert self._frame is not None, "Expected a keyframe first"
+        tiles = _as_tiles(self._frame, tile_size)
+        changed = np.frombuffer(payload, dtype=np.uint32, count=num_changed)
+        residuals = np.frombuffer(
+            payload, dtype=np.uint8, offset=changed.nbytes
+        ).reshape((num_changed,) + tiles.shape[2:])
+
+        rows, cols = np.divmod(changed, tiles.shape[1])
+        tiles[rows, cols] ^= residuals
+        return self._frame[:h, :w].copy()
+
+
+def write_message(stream, message):
+    """
+    Writes one length-prefixed message to a binary stream, e.g. the write end
+    of a pipe or `socket.makefile("wb")`.
+    """
+    stream.write(_LENGTH.pack(len(message)))
+    stream.write(message)
+    stream.flush()
+
+
+def read_message(stream):
+    """
+    Reads one message written by `write_message()`. Returns None at EOF.
+    """
+    prefix = stream.read(_LENGTH.size)
+    if len(prefix) < _LENGTH.size:
+        return None
+    (length,) = _LENGTH.unpack(prefix)
+    return stream.read(length)
+
+
+def _alloc_padded(shape, tile_size):
+    h, w, c = shape
+    padded_h = -(-h // tile_size) * tile_size
+    padded_w = -(-w // tile_size) * tile_size
+    return np.zeros((padded_h, padded_w, c), dtype=np.uint8)
+
+
+def _as_tiles(padded, tile_size):
+    """
+    (num_tiles_y, num_tiles_x, tile_size, tile_size, c) view of `padded`.
+    """
+    h, w, c = padded.shape
+    return padded.reshape(
+        h // tile_size, tile_size, w // tile_size, tile_size, c
+    ).swapaxes(1, 2)
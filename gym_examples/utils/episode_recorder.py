@@ -0,0 +1,102 @@
+import numpy as np
+
+
+class NpzChunkSink:
+    """
+    Writes frames to `out_dir/chunk_00000.npz`, `out_dir/chunk_00001.npz`, ...
+    with `chunk_size` frames each, under the key "frames".
+
+    Frames are copied into one buffer that is allocated on the first frame and
+    reused for every chunk, so memory stays bounded by `chunk_size` frames.
+    """
+
+    def __init__(self, out_dir, chunk_size=256, compress=True):
+        self.out_dir = out_dir
+        self.chunk_size = chunk_size
+        self.compress = compress
+        self.out_dir.mkdir(parents=True, exist_ok=True)
+
+        self._buf = None
+        self._num_buffered = 0
+        self._num_chunks = 0
+
+    def write(self, frame):
+        if self._buf is None:
+            self._buf = np.empty((self.chunk_size,) + frame.shape, dtype=frame.dtype)
+        self._buf[self._num_buffered] = frame
+        self._num_buffered += 1
+        if self._num_buffered == self.chunk_size:
+            self.flush()
+
+    def flush(self):
+        if self._num_buffered == 0:
+            return
+        path = self.out_dir / f"chunk_{self._num_chunks:05d}.npz"
+        save = np.savez_compressed if self.compress else np.savez
+        save(str(path), frames=self._buf[: self._num_buffered])
+        self._num_buffered = 0
+        self._num_chunks += 1
+
+    def close(self):
+        self.flush()
+
+
+class VideoSink:
+    """
+    Encodes frames into a video file as they arrive. Requires `imageio` with
+    the ffmpeg plugin, which is an optional dependency.
+    """
+
+    def __init__(self, path, fps=4):
+        try:
+            import imageio.v2 as imageio
+        except ImportError as e:
+            raise ImportError(
+                "VideoSink requires imageio, install with `pip install imageio[ffmpeg]`"
+            ) from e
+        self._writer = imageio.get_writer(str(path), fps=fps)
+
+    def write(self, frame):
+        self._writer.append_data(frame)
+
+    def close(self):
+        self._writer.close()
+
+
+class EpisodeRecorder:
+    """
+    Streams rgb_array frames to `sink` (`NpzChunkSink` or `VideoSink`) as they
+    are captured, instead of accumulating them until the end of the episode.
+
+    `frame_skip`: keep one frame out of every `frame_skip` captured.
+    `downscale`: keep one pixel out of every `downscale` along each axis. The
+    frame is subsampled with a strided view, so only the kept pixels are
+    copied into the sink.
+    """
+
+    def __init__(self, sink, frame_skip=1, downscale=1):
+        self.sink = sink
+        self.frame_skip = frame_skip
+        self.downscale = downscale
+        self._num_captured = 0
+
+    def wants_frame(self):
+        """
+        Whether the next captured frame is kept. Callers can check this to
+        not render frames that `frame_skip` drops, and `skip()` them instead.
+        """
+        return self._num_captured % self.frame_skip == 0
+
+    def capture(self, frame):
+        if self.wants_frame():
+            self.sink.write(frame[:: self.downscale, :: self.downscale])
+        self._num_captured += 1
+
+    def skip(self):
+        """
+        Counts a frame towards `frame_skip` without rendering it.
+        """
+        self._num_captured += 1
+
+    def close(self):
+        self.sink.close()
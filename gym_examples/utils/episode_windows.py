@@ -0,0 +1,45 @@
+import numpy as np
+
+
+class EpisodeWindowSampler:
+    """
+    Draws episode windows of `length` frames uniformly across footage of
+    `num_frames` frames. Each window is a dict that can be passed as-is to
+    `PtzCameraRealEnv.reset(options=...)`.
+
+    The i-th window only depends on `seed` and `i`, so `plan()` can be called
+    at any time to know which frames the next episodes will play, e.g. to
+    warm a prefetcher, without changing what `sample()` returns.
+    """
+
+    def __init__(self, num_frames, length, seed=None):
+        assert 2 <= length <= num_frames, "An episode needs at least one step"
+        self.num_frames = num_frames
+        self.length = length
+        # Fixed up front, so that windows are reproducible even without a seed
+        self.entropy = np.random.SeedSequence(seed).entropy
+        self.num_sampled = 0
+
+    def get_window(self, episode_id):
+        """
+        The window of the `episode_id`-th episode.
+        """
+        rng = np.random.default_rng([self.entropy, episode_id])
+        start_frame = int(rng.integers(0, self.num_frames - self.length + 1))
+        return {"start_frame": start_frame, "length": self.length}
+
+    def sample(self):
+        window = self.get_window(self.num_sampled)
+        self.num_sampled += 1
+        return window
+
+    def plan(self, num_episodes):
+        """
+        The next `num_episodes` windows that `sample()` will return. Does not
+        advance the sampler.
+        """
+        return [self.get_window(self.num_sampled + i) for i in range(num_episodes)]
+
+    @staticmethod
+    def get_frame_ids(window):
+        return range(window["start_frame"], window["start_frame"] + window["length"])
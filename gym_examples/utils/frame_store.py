@@ -0,0 +1,87 @@
+from collections import OrderedDict
+
+import numpy as np
+
+
+class FrameStore:
+    """
+    Frames of the footage of a `PtzCameraRealEnv`, from which viewport crops
+    of many (frame_id, vp_x, vp_y) references can be materialized at once.
+
+    By default frames are decoded lazily, the first time a reference to them
+    is gathered, and only the `max_cached_frames` most recently used decoded
+    frames are kept in RAM. So memory stays bounded however long the footage.
+
+    `cache_path`: if given, all frames are instead decoded once into a .npy
+    file of shape (num_frames, img_h, img_w, 3) that is memory-mapped, so
+    that a batch is materialized with a single gather. The file is created on
+    first use and reused afterwards.
+    """
+
+    def __init__(self, env, cache_path=None, max_cached_frames=64):
+        env = env.unwrapped
+        self.env = env
+        self.grid_size_x, self.grid_size_y = env.get_grid_wh()
+        self.viewport_size_x = env.viewport_size_x
+        self.viewport_size_y = env.viewport_size_y
+        self.num_frames = len(env.frames)
+        self.max_cached_frames = max_cached_frames
+        # Decoded frames by frame id, least recently used first. Only used
+        # without `cache_path`.
+        self._decoded = OrderedDict()
+
+        if cache_path is None:
+            self.frames = None
+            return
+
+        shape = (self.num_frames, env.img_h, env.img_w, 3)
+        if cache_path.exists():
+            self.frames = np.load(str(cache_path), mmap_mode="r")
+            assert self.frames.shape == shape
+            return
+
+        self.frames = np.lib.format.open_memmap(
+            str(cache_path), mode="w+", dtype=np.uint8, shape=shape
+        )
+        for frame_id in range(self.num_frames):
+            self.frames[frame_id] = env._decode_frame(frame_id)
+        self.frames.flush()
+
+    def __len__(self):
+        return self.num_frames
+
+    def gather(self, refs):
+        """
+        `refs`: (batch, 3) array of (frame_id, vp_x, vp_y), as emitted by
+        `PtzCameraRealEnv` with `obs_mode="ref"`.
+
+        Returns the (batch, viewport_size_y, viewport_size_x, 3) viewports.
+        """
+        refs = np.asarray(refs)
+        frame_ids = refs[:, 0]
+        ys = refs[:, 2] * self.grid_size_y
+        xs = refs[:, 1] * self.grid_size_x
+
+        if self.frames is not None:
+            rows = ys[:, None] + np.arange(self.viewport_size_y)
+            cols = xs[:, None] + np.arange(self.viewport_size_x)
+            return self.frames[
+                frame_ids[:, None, None], rows[:, :, None], cols[:, None, :]
+            ]
+
+        out = np.empty(
+            (len(refs), self.viewport_size_y, self.viewport_size_x, 3), dtype=np.uint8
+        )
+        for i, (frame_id, y, x) in enumerate(zip(frame_ids, ys, xs)):
+            frame = self._get_frame(int(frame_id))
+            out[i] = frame[y : y + self.viewport_size_y, x : x + self.viewport_size_x]
+        return out
+
+    def _get_frame(self, frame_id):
+        frame = self._decoded.pop(frame_id, None)
+        if frame is None:
+            frame = self.env._decode_frame(frame_id)
+            if len(self._decoded) >= self.max_cached_frames:
+                self._decoded.popitem(last=False)
+        self._decoded[frame_id] = frame
+        return frame
@@ -0,0 +1,134 @@
+"""
+Offline oracle index for `UnrestrictedPtzCameraRealEnv`: the score of every
+viewport of every frame of a footage directory, precomputed once with a
+process pool and stored as a (num_frames, num_vp_x, num_vp_y) float32 .npy.
+
+Usage:
+    python -m gym_examples.utils.oracle_index FRAMES_DIR OUT_PATH
+"""
+import argparse
+import functools
+import pathlib
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+from PIL import Image
+
+
+def motion_energy(view, prev_view):
+    """
+    Mean absolute pixel difference against the same viewport in the previous
+    frame. 0 for the first frame.
+    """
+    if prev_view is None:
+        return 0.0
+    return float(np.mean(np.abs(view.astype(np.int16) - prev_view)))
+
+
+def _score_frames(
+    frame_paths,
+    prev_path,
+    score_fn,
+    grid_size_x,
+    grid_size_y,
+    num_grid_viewport_x,
+    num_grid_viewport_y,
+    num_vp_x,
+    num_vp_y,
+):
+    """
+    Scores all viewports of `frame_paths`. `prev_path` is the frame before the
+    first one, or None.
+    """
+
+    def crop(img, x, y):
+        return img[
+            y * grid_size_y : (y + num_grid_viewport_y) * grid_size_y,
+            x * grid_size_x : (x + num_grid_viewport_x) * grid_size_x,
+        ]
+
+    scores = np.zeros((len(frame_paths), num_vp_x, num_vp_y), dtype=np.float32)
+    prev_img = None if prev_path is None else np.array(Image.open(str(prev_path)))
+    for i, path in enumerate(frame_paths):
+        img = np.array(Image.open(str(path)))
+        for x in range(num_vp_x):
+            for y in range(num_vp_y):
+                prev_view = None if prev_img is None else crop(prev_img, x, y)
+                scores[i, x, y] = score_fn(crop(img, x, y), prev_view)
+        prev_img = img
+    return scores
+
+
+def build_oracle_index(
+    env, out_path, score_fn=motion_energy, processes=None, chunk_size=64
+):
+    """
+    Scores every viewport of every frame of `env`'s footage and writes the
+    (num_frames, num_vp_x, num_vp_y) array to `out_path`.
+
+    `score_fn(view, prev_view)`: returns the score of one viewport crop.
+    `prev_view` is the same viewport in the previous frame, or None for the
+    first frame. It must be picklable, i.e. defined at module level.
+    """
+    grid_size_x, grid_size_y = env.get_grid_wh()
+    num_grid_x, num_grid_y = env.get_num_grids_wh()
+    num_grid_viewport_x, num_grid_viewport_y = env.get_num_grids_viewport_wh()
+    num_vp_x = num_grid_x - num_grid_viewport_x + 1
+    num_vp_y = num_grid_y - num_grid_viewport_y + 1
+
+    frames = env.frames
+    starts = range(0, len(frames), chunk_size)
+    score_chunk = functools.partial(
+        _score_frames,
+        score_fn=score_fn,
+        grid_size_x=grid_size_x,
+        grid_size_y=grid_size_y,
+        num_grid_viewport_x=num_grid_viewport_x,
+        num_grid_viewport_y=num_grid_viewport_y,
+        num_vp_x=num_vp_x,
+        num_vp_y=num_vp_y,
+    )
+
+    scores = np.lib.format.open_memmap(
+        str(out_path),
+        mode="w+",
+        dtype=np.float32,
+        shape=(len(frames), num_vp_x, num_vp_y),
+    )
+    with ProcessPoolExecutor(max_workers=processes) as executor:
+        chunks = executor.map(
+            score_chunk,
+            [frames[s : s + chunk_size] for s in starts],
+            [frames[s - 1] if s > 0 else None for s in starts],
+        )
+        for s, chunk in zip(starts, chunks):
+            scores[s : s + len(chunk)] = chunk
+    scores.flush()
+    return scores
+
+
+def main():
+    from gym_examples.envs import PtzCameraRealEnv
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument("frames_dir", type=pathlib.Path)
+    parser.add_argument("out_path", type=pathlib.Path)
+    parser.add_argument("--num-grid-x", type=int, default=9)
+    parser.add_argument("--num-grid-y", type=int, default=5)
+    parser.add_argument("--num-grid-viewport-x", type=int, default=5)
+    parser.add_argument("--num-grid-viewport-y", type=int, default=3)
+    parser.add_argument("--processes", type=int, default=None)
+    args = parser.parse_args()
+
+    env = PtzCameraRealEnv(
+        args.frames_dir,
+        num_grid_x=args.num_grid_x,
+        num_grid_y=args.num_grid_y,
+        num_grid_viewport_x=args.num_grid_viewport_x,
+        num_grid_viewport_y=args.num_grid_viewport_y,
+    )
+    build_oracle_index(env, args.out_path, processes=args.processes)
+
+
+if __name__ == "__main__":
+    main()
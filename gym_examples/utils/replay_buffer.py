@@ -0,0 +1,57 @@
+import numpy as np
+
+
+class FrameRefReplayBuffer:
+    """
+    Replay buffer for `PtzCameraRealEnv` with `obs_mode="ref"`. Only the
+    (frame_id, vp_x, vp_y) references are stored; `sample()` materializes the
+    pixels of both the observations and the next observations of a batch
+    with a single `FrameStore.gather()`.
+
+    When full, the oldest transitions are overwritten.
+    """
+
+    def __init__(self, capacity, frame_store, action_shape=(), action_dtype=np.int64):
+        self.capacity = capacity
+        self.frame_store = frame_store
+
+        self.obs = np.zeros((capacity, 3), dtype=np.int64)
+        self.next_obs = np.zeros((capacity, 3), dtype=np.int64)
+        self.actions = np.zeros((capacity,) + tuple(action_shape), dtype=action_dtype)
+        self.rewards = np.zeros(capacity, dtype=np.float32)
+        self.terminated = np.zeros(capacity, dtype=bool)
+
+        self.pos = 0
+        self.size = 0
+
+    def __len__(self):
+        return self.size
+
+    def add(self, obs, action, reward, next_obs, terminated):
+        self.obs[self.pos] = obs
+        self.next_obs[self.pos] = next_obs
+        self.actions[self.pos] = action
+        self.rewards[self.pos] = reward
+        self.terminated[self.pos] = terminated
+
+        self.pos = (self.pos + 1) % self.capacity
+        self.size = min(self.size + 1, self.capacity)
+
+    def sample(self, batch_size, rng=None):
+        """
+        Returns a dict of batched "obs", "action", "reward", "next_obs" and
+        "terminated", with "obs" and "next_obs" as pixels.
+        """
+        if rng is None:
+            rng = np.random.default_rng()
+        idx = rng.integers(0, self.size, size=batch_size)
+
+        refs = np.concatenate([self.obs[idx], self.next_obs[idx]])
+        pixels = self.frame_store.gather(refs)
+        return {
+            "obs": pixels[:batch_size],
+            "action": self.actions[idx],
+            "reward": self.rewards[idx],
+            "next_obs": pixels[batch_size:],
+            "terminated": self.terminated[idx],
+        }
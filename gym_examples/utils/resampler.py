@@ -0,0 +1,110 @@
+import numpy as np
+
+
+class ViewportResampler:
+    """
+    Crops a viewport at a continuous (x, y, zoom) out of a panorama and
+    resamples it to the fixed `viewport_wh` with nearest-neighbour sampling.
+
+    At zoom 1 the crop is `viewport_wh` large, at zoom z it is `viewport_wh / z`
+    large. `x` and `y` in [0, 1] place the crop between the left/top and the
+    right/bottom edge of the panorama.
+
+    Zoom is quantized to `num_zoom_levels` levels between `min_zoom` and
+    `max_zoom`, and the row and column index maps of every level are
+    precomputed. Resampling first builds the `crop_h` crop rows at the output
+    width, then repeats whole rows. At low zoom most output columns come in
+    long runs of consecutive crop columns, which are copied as slices. At
+    higher zoom the columns are gathered with a column map over the bytes of
+    a row, i.e. with the channel axis folded in. Levels whose crop has the
+    size of the viewport are a plain crop.
+    """
+
+    def __init__(
+        self,
+        panoramic_wh,
+        viewport_wh,
+        min_zoom=1.0,
+        max_zoom=4.0,
+        num_zoom_levels=64,
+    ):
+        self.panoramic_w, self.panoramic_h = panoramic_wh
+        self.viewport_w, self.viewport_h = viewport_wh
+        self.zooms = np.linspace(min_zoom, max_zoom, num_zoom_levels)
+
+        self._crop_wh = []
+        self._row_maps = []
+        self._col_maps = []
+        # Number of times each crop row appears in the output
+        self._row_repeats = []
+        # (start, stop, crop column of start) of the runs of consecutive crop
+        # columns in the output, or None if runs are too short to pay off
+        self._col_runs = []
+        # Column maps over the bytes of a row, by (zoom level, channels)
+        self._flat_col_maps = {}
+        for zoom in self.zooms:
+            crop_w = max(int(round(self.viewport_w / zoom)), 1)
+            crop_h = max(int(round(self.viewport_h / zoom)), 1)
+            assert (
+                crop_w <= self.panoramic_w and crop_h <= self.panoramic_h
+            ), f"Viewport does not fit in the panorama at zoom {zoom}"
+            self._crop_wh.append((crop_w, crop_h))
+            # Sample at the center of each output pixel
+            row_map = (
+                (np.arange(self.viewport_h) + 0.5) * crop_h / self.viewport_h
+            ).astype(np.intp)
+            self._row_maps.append(row_map)
+            self._row_repeats.append(np.bincount(row_map, minlength=crop_h))
+            col_map = (
+                (np.arange(self.viewport_w) + 0.5) * crop_w / self.viewport_w
+            ).astype(np.intp)
+            self._col_maps.append(col_map)
+            self._col_runs.append(self._get_col_runs(col_map))
+
+    def get_rect(self, x, y, zoom):
+        """
+        Returns (left, top, width, height, zoom_level) of the crop in pixels.
+        """
+        zoom_level = int(np.abs(self.zooms - zoom).argmin())
+        crop_w, crop_h = self._crop_wh[zoom_level]
+        left = int(round(float(np.clip(x, 0, 1)) * (self.panoramic_w - crop_w)))
+        top = int(round(float(np.clip(y, 0, 1)) * (self.panoramic_h - crop_h)))
+        return (left, top, crop_w, crop_h, zoom_level)
+
+    def resample(self, img, rect):
+        """
+        `img`: (h, w, c) panorama. `rect`: as returned by `get_rect()`.
+
+        Returns a new (viewport_h, viewport_w, c) array.
+        """
+        left, top, crop_w, crop_h, zoom_level = rect
+        crop = img[top : top + crop_h, left : left + crop_w]
+        if crop_w == self.viewport_w and crop_h == self.viewport_h:
+            return crop.copy()
+        c = crop.shape[2]
+        col_runs = self._col_runs[zoom_level]
+        if col_runs is not None:
+            cols = np.empty((crop_h, self.viewport_w, c), dtype=img.dtype)
+            for start, stop, src in col_runs:
+                cols[:, start:stop] = crop[:, src : src + stop - start]
+        else:
+            # A view if the pixels of a row are contiguous, as in decoded frames
+            rows = crop.reshape(crop_h, crop_w * c)
+            cols = np.take(rows, self._get_flat_col_map(zoom_level, c), axis=1)
+            cols = cols.reshape(crop_h, self.viewport_w, c)
+        return np.repeat(cols, self._row_repeats[zoom_level], axis=0)
+
+    def _get_col_runs(self, col_map):
+        starts = np.flatnonzero(np.diff(col_map, prepend=-2) != 1)
+        # Slice copies beat a gather once runs are a few pixels long
+        if len(starts) * 3 > self.viewport_w:
+            return None
+        stops = np.append(starts[1:], len(col_map))
+        return list(zip(starts.tolist(), stops.tolist(), col_map[starts].tolist()))
+
+    def _get_flat_col_map(self, zoom_level, c):
+        key = (zoom_level, c)
+        if key not in self._flat_col_maps:
+            col_map = self._col_maps[zoom_level]
+            self._flat_col_maps[key] = (col_map[:, None] * c + np.arange(c)).ravel()
+        return self._flat_col_maps[key]
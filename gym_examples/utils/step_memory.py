@@ -0,0 +1,159 @@
+"""
+Memory regression harness for the step loop of the registered envs.
+
+Each env is stepped under `tracemalloc`, reporting the memory allocated by a
+single step (peak above the level before the step), the overall peak, and the
+steady-state growth of live memory per step after a warm-up.
+
+Usage:
+    python -m gym_examples.utils.step_memory [--max-step-bytes N]
+        [--max-growth-bytes N] [--frames-dir DIR]
+
+Exits with status 1 if any env exceeds a budget.
+"""
+import argparse
+import inspect
+import pathlib
+import sys
+import tracemalloc
+from collections import namedtuple
+
+import gymnasium as gym
+from gymnasium.envs.registration import load_env_creator
+
+StepMemoryReport = namedtuple(
+    "StepMemoryReport",
+    ["mean_step_bytes", "max_step_bytes", "peak_bytes", "growth_bytes_per_step"],
+)
+
+
+def measure_step_memory(
+    env, num_steps=1000, warmup_steps=100, seed=0, reset_options=None
+):
+    """
+    Steps `env` with random actions for `warmup_steps`, then for `num_steps`
+    under `tracemalloc`. Episodes that end are reset with `reset_options`
+    without being measured. Observations are dropped right away, as in a loop
+    that only keeps the latest one.
+
+    Only memory allocated through Python's allocators is traced, e.g. numpy
+    arrays but not the pixel buffers of pygame surfaces.
+    """
+    env.action_space.seed(seed)
+    env.reset(seed=seed, options=reset_options)
+
+    def step():
+        _, _, terminated, truncated, _ = env.step(env.action_space.sample())
+        if terminated or truncated:
+            env.reset(options=reset_options)
+            return False
+        return True
+
+    for _ in range(warmup_steps):
+        step()
+
+    tracemalloc.start()
+    try:
+        # Running totals rather than a list, to not count the harness's own
+        # growth as the env's
+        peak_bytes = 0
+        total_step_bytes = 0
+        max_step_bytes = 0
+        num_measured = 0
+        start_bytes, _ = tracemalloc.get_traced_memory()
+        for _ in range(num_steps):
+            before, _ = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+            measured = step()
+            _, peak = tracemalloc.get_traced_memory()
+            peak_bytes = max(peak_bytes, peak)
+            if measured:
+                total_step_bytes += peak - before
+                max_step_bytes = max(max_step_bytes, peak - before)
+                num_measured += 1
+        end_bytes, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return StepMemoryReport(
+        mean_step_bytes=total_step_bytes / max(num_measured, 1),
+        max_step_bytes=max_step_bytes,
+        peak_bytes=peak_bytes,
+        growth_bytes_per_step=(end_bytes - start_bytes) / num_steps,
+    )
+
+
+def is_over_budget(report, max_step_bytes=None, max_growth_bytes=None):
+    """
+    Whether `report` exceeds either budget. A budget of None is unlimited.
+    """
+    if max_step_bytes is not None and report.mean_step_bytes > max_step_bytes:
+        return True
+    if max_growth_bytes is not None and report.growth_bytes_per_step > max_growth_bytes:
+        return True
+    return False
+
+
+def needs_frames_dir(env_id):
+    """
+    Whether the env replays footage, i.e. its constructor takes a
+    `frames_dir` that the registration does not provide.
+    """
+    spec = gym.spec(env_id)
+    if "frames_dir" in spec.kwargs:
+        return False
+    env_creator = load_env_creator(spec.entry_point)
+    return "frames_dir" in inspect.signature(env_creator).parameters
+
+
+def get_env_ids(frames_dir=None):
+    env_ids = [env_id for env_id in gym.registry if env_id.startswith("gym_examples/")]
+    if frames_dir is None:
+        env_ids = [env_id for env_id in env_ids if not needs_frames_dir(env_id)]
+    return env_ids
+
+
+def main():
+    import gym_examples  # noqa: F401, registers the envs
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--env-id", action="append", default=None)
+    parser.add_argument("--steps", type=int, default=1000)
+    parser.add_argument("--warmup-steps", type=int, default=100)
+    parser.add_argument("--max-step-bytes", type=float, default=None)
+    parser.add_argument("--max-growth-bytes", type=float, default=None)
+    parser.add_argument("--frames-dir", type=pathlib.Path, default=None)
+    args = parser.parse_args()
+
+    failed = False
+    for env_id in args.env_id or get_env_ids(args.frames_dir):
+        kwargs = {}
+        reset_options = None
+        if needs_frames_dir(env_id):
+            # Replay the whole footage in a loop
+            kwargs["frames_dir"] = args.frames_dir
+            num_frames = len(list(args.frames_dir.glob("*.png")))
+            reset_options = {"start_frame": 0, "length": num_frames}
+        env = gym.make(env_id, **kwargs)
+        report = measure_step_memory(
+            env,
+            num_steps=args.steps,
+            warmup_steps=args.warmup_steps,
+            reset_options=reset_options,
+        )
+        env.close()
+
+        over_budget = is_over_budget(report, args.max_step_bytes, args.max_growth_bytes)
+        failed = failed or over_budget
+        print(
+            f"{'FAIL' if over_budget else 'ok  '} {env_id}: "
+            f"{report.mean_step_bytes:.0f} B/step (max {report.max_step_bytes}), "
+            f"peak {report.peak_bytes} B, "
+            f"growth {report.growth_bytes_per_step:.1f} B/step"
+        )
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+import multiprocessing
+from multiprocessing import shared_memory
+
+import numpy as np
+
+
+def _viewer_main(shm_name, window_size, fps, stop_event):
+    import pygame
+
+    shm = shared_memory.SharedMemory(name=shm_name)
+    seq, frame = _as_arrays(shm.buf, window_size)
+    buf = np.zeros_like(frame)
+
+    pygame.init()
+    pygame.display.init()
+    window = pygame.display.set_mode(window_size)
+    clock = pygame.time.Clock()
+
+    last_seq = 0
+    while not stop_event.is_set():
+        if any(e.type == pygame.QUIT for e in pygame.event.get()):
+            break
+
+        # Frames are published seqlock-style: `seq` is odd while a frame is
+        # being written. Skip torn reads and try again on the next tick.
+        seq_before = int(seq[0])
+        if seq_before != last_seq and seq_before % 2 == 0:
+            buf[...] = frame
+            if int(seq[0]) == seq_before:
+                last_seq = seq_before
+                pygame.surfarray.blit_array(window, buf)
+                pygame.display.update()
+
+        clock.tick(fps)
+
+    pygame.display.quit()
+    pygame.quit()
+    del seq, frame
+    shm.close()
+
+
+def _as_arrays(buf, window_size):
+    w, h = window_size
+    seq = np.ndarray((1,), dtype=np.uint64, buffer=buf)
+    frame = np.ndarray((w, h, 3), dtype=np.uint8, buffer=buf, offset=8)
+    return seq, frame
+
+
+class SharedMemoryViewer:
+    """
+    Displays frames in a separate process, so that human rendering does not
+    throttle the process that steps the env.
+
+    `publish()` copies the frame into shared memory and returns immediately.
+    The viewer process draws the latest published frame at its own `fps`,
+    dropping any frames published in between.
+
+    Frames are (w, h, 3) uint8 arrays, i.e. in the layout of
+    `pygame.surfarray.pixels3d()`.
+    """
+
+    def __init__(self, window_size, fps=30):
+        self.window_size = window_size
+        w, h = window_size
+        self._shm = shared_memory.SharedMemory(create=True, size=8 + w * h * 3)
+        self._seq, self._frame = _as_arrays(self._shm.buf, window_size)
+        self._seq[0] = 0
+
+        ctx = multiprocessing.get_context("spawn")
+        self._stop_event = ctx.Event()
+        self._process = ctx.Process(
+            target=_viewer_main,
+            args=(self._shm.name, window_size, fps, self._stop_event),
+            daemon=True,
+        )
+        self._process.start()
+
+    def publish(self, frame):
+        self._seq[0] += 1
+        self._frame[...] = frame
+        self._seq[0] += 1
+
+    def close(self):
+        self._stop_event.set()
+        self._process.join()
+        del self._seq, self._frame
+        self._shm.close()
+        self._shm.unlink()
@@ -1,4 +1,24 @@
-from gym_examples.wrappers.clip_reward import ClipReward
-from gym_examples.wrappers.discrete_actions import DiscreteActions
-from gym_examples.wrappers.reacher_weighted_reward import ReacherRewardWrapper
-from gym_examples.wrappers.relative_position import RelativePosition
+import importlib
+
+# Wrapper modules are imported on first access, so that e.g. the gymnasium
+# vector wrappers can be used without the legacy `gym` package.
+_wrapper_modules = {
+    "ClipReward": "clip_reward",
+    "DiscreteActions": "discrete_actions",
+    "ReacherRewardWrapper": "reacher_weighted_reward",
+    "RelativePosition": "relative_position",
+    "RecordEpisodeFrames": "record_episode",
+}
+
+__all__ = list(_wrapper_modules)
+
+
+def __getattr__(name):
+    if name in _wrapper_modules:
+        module = importlib.import_module(f"{__name__}.{_wrapper_modules[name]}")
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
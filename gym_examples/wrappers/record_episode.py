@@ -0,0 +1,34 @@
+import gymnasium
+
+
+class RecordEpisodeFrames(gymnasium.Wrapper):
+    """
+    Captures `env.render()` after every reset and step into an
+    `EpisodeRecorder`. The env must use `render_mode="rgb_array"`. Frames that
+    the recorder's `frame_skip` drops are not rendered at all.
+    """
+
+    def __init__(self, env, recorder):
+        super().__init__(env)
+        assert env.render_mode == "rgb_array"
+        self.recorder = recorder
+
+    def reset(self, **kwargs):
+        ret = self.env.reset(**kwargs)
+        self._capture()
+        return ret
+
+    def step(self, action):
+        ret = self.env.step(action)
+        self._capture()
+        return ret
+
+    def _capture(self):
+        if self.recorder.wants_frame():
+            self.recorder.capture(self.env.render())
+        else:
+            self.recorder.skip()
+
+    def close(self):
+        self.recorder.close()
+        super().close()
@@ -0,0 +1,4 @@
+from gym_examples.wrappers.vector.clip_reward import VectorClipReward
+from gym_examples.wrappers.vector.discrete_actions import VectorDiscreteActions
+from gym_examples.wrappers.vector.ptz_move_actions import VectorPtzMoveActions
+from gym_examples.wrappers.vector.relative_position import VectorRelativePosition
@@ -0,0 +1,12 @@
+import numpy as np
+from gymnasium.vector import VectorRewardWrapper
+
+
+class VectorClipReward(VectorRewardWrapper):
+    def __init__(self, env, min_reward, max_reward):
+        super().__init__(env)
+        self.min_reward = min_reward
+        self.max_reward = max_reward
+
+    def rewards(self, rewards):
+        return np.clip(rewards, self.min_reward, self.max_reward)
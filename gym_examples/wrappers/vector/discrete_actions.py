@@ -0,0 +1,20 @@
+import numpy as np
+from gymnasium.spaces import Discrete
+from gymnasium.vector import VectorActionWrapper
+from gymnasium.vector.utils import batch_space
+
+
+class VectorDiscreteActions(VectorActionWrapper):
+    """
+    Batched `DiscreteActions`: the whole batch of discrete actions is mapped
+    with one lookup into an array stacking `disc_to_cont`.
+    """
+
+    def __init__(self, env, disc_to_cont):
+        super().__init__(env)
+        self.disc_to_cont = np.asarray(disc_to_cont)
+        self.single_action_space = Discrete(len(disc_to_cont))
+        self.action_space = batch_space(self.single_action_space, self.num_envs)
+
+    def actions(self, actions):
+        return self.disc_to_cont[actions]
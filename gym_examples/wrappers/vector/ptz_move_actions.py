@@ -0,0 +1,49 @@
+import numpy as np
+from gymnasium.spaces import Discrete
+from gymnasium.vector import VectorWrapper
+from gymnasium.vector.utils import batch_space
+
+
+class VectorPtzMoveActions(VectorWrapper):
+    """
+    Drives vectorized `UnrestrictedPtzCameraEnv`s (or
+    `UnrestrictedPtzCameraRealEnv`s) with the one-step moves of
+    `PtzCameraEnv`: "no-op", "right", "up", "left", "down". The moves of the
+    whole batch are turned into (x, y) viewport targets with one table lookup,
+    an add and a clip.
+
+    The current viewport of each env is tracked here and only re-read from
+    `info["vp"]` after an env got reset.
+    """
+
+    def __init__(self, env):
+        super().__init__(env)
+        self._action_to_direction = np.array(
+            [[1, 0], [0, 1], [-1, 0], [0, -1], [0, 0]], dtype=np.int64
+        )
+        self._max_vp = np.asarray(env.single_action_space.nvec, dtype=np.int64) - 1
+
+        self.single_action_space = Discrete(len(self._action_to_direction))
+        self.action_space = batch_space(self.single_action_space, self.num_envs)
+
+        self._vps = None
+        self._autoreset = np.zeros(self.num_envs, dtype=bool)
+
+    def reset(self, *, seed=None, options=None):
+        observations, infos = self.env.reset(seed=seed, options=options)
+        self._vps = np.array(list(infos["vp"]), dtype=np.int64)
+        self._autoreset[:] = False
+        return observations, infos
+
+    def step(self, actions):
+        targets = np.clip(
+            self._vps + self._action_to_direction[actions], 0, self._max_vp
+        )
+        observations, rewards, terminated, truncated, infos = self.env.step(targets)
+
+        self._vps = targets
+        for i in np.flatnonzero(self._autoreset):
+            self._vps[i] = infos["vp"][i]
+        self._autoreset = np.logical_or(terminated, truncated)
+
+        return observations, rewards, terminated, truncated, infos
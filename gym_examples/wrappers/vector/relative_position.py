@@ -0,0 +1,16 @@
+import numpy as np
+from gymnasium.spaces import Box
+from gymnasium.vector import VectorObservationWrapper
+from gymnasium.vector.utils import batch_space
+
+
+class VectorRelativePosition(VectorObservationWrapper):
+    def __init__(self, env):
+        super().__init__(env)
+        self.single_observation_space = Box(shape=(2,), low=-np.inf, high=np.inf)
+        self.observation_space = batch_space(
+            self.single_observation_space, self.num_envs
+        )
+
+    def observations(self, observations):
+        return observations["target"] - observations["agent"]
@@ -0,0 +1,15 @@
+import numpy as np
+import pytest
+from PIL import Image
+
+
+@pytest.fixture
+def frames_dir(tmp_path):
+    """
+    A directory of 20 random 450x250 PNG frames.
+    """
+    rng = np.random.default_rng(0)
+    for i in range(20):
+        img = rng.integers(0, 256, size=(250, 450, 3), dtype=np.uint8)
+        Image.fromarray(img).save(tmp_path / f"{i:05d}.png")
+    return tmp_path
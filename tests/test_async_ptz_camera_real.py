@@ -0,0 +1,89 @@
+import asyncio
+
+import gymnasium as gym
+import numpy as np
+
+import gym_examples  # noqa: F401
+from gym_examples.envs import AsyncPtzCameraRealEnv, PtzCameraRealEnv
+
+ACTIONS = [0, 1, 2, 3, 4, 1, 1, 0]
+
+
+def _run_async(frames_dir, resets, make_env=PtzCameraRealEnv):
+    async def run():
+        env = AsyncPtzCameraRealEnv(make_env(frames_dir))
+        episodes = []
+        for options in resets:
+            obs, _ = await env.reset(options=options)
+            episode = [obs.copy()]
+            for action in ACTIONS:
+                obs, _, terminated, truncated, info = await env.step(action)
+                episode.append((obs.copy(), terminated, truncated, info["vp"]))
+                if terminated or truncated:
+                    break
+            episodes.append(episode)
+        env.close()
+        return episodes
+
+    return asyncio.run(run())
+
+
+def _run_sync(frames_dir, resets):
+    env = PtzCameraRealEnv(frames_dir)
+    episodes = []
+    for options in resets:
+        obs, _ = env.reset(options=options)
+        episode = [obs.copy()]
+        for action in ACTIONS:
+            obs, _, terminated, truncated, info = env.step(action)
+            episode.append((obs.copy(), terminated, truncated, info["vp"]))
+            if terminated or truncated:
+                break
+        episodes.append(episode)
+    return episodes
+
+
+def _assert_episodes_equal(actual, expected):
+    assert len(actual) == len(expected)
+    for actual_episode, expected_episode in zip(actual, expected):
+        assert len(actual_episode) == len(expected_episode)
+        np.testing.assert_array_equal(actual_episode[0], expected_episode[0])
+        for (obs, te, tr, vp), (obs_, te_, tr_, vp_) in zip(
+            actual_episode[1:], expected_episode[1:]
+        ):
+            np.testing.assert_array_equal(obs, obs_)
+            assert (te, tr, tuple(vp)) == (te_, tr_, tuple(vp_))
+
+
+def test_matches_sync_env(frames_dir):
+    resets = [None]
+    _assert_episodes_equal(
+        _run_async(frames_dir, resets), _run_sync(frames_dir, resets)
+    )
+
+
+def test_matches_sync_env_across_start_frame_resets(frames_dir):
+    # Resetting mid-episode drops the frame prefetched for the old episode
+    resets = [None, {"start_frame": 3}, {"start_frame": 10, "length": 4}]
+    _assert_episodes_equal(
+        _run_async(frames_dir, resets), _run_sync(frames_dir, resets)
+    )
+
+
+def test_wraps_gym_make_env(frames_dir):
+    def make_env(frames_dir):
+        return gym.make("gym_examples/PtzCameraReal", frames_dir=frames_dir)
+
+    resets = [None, {"start_frame": 3}]
+    _assert_episodes_equal(
+        _run_async(frames_dir, resets, make_env), _run_sync(frames_dir, resets)
+    )
+
+
+def test_end_of_footage(frames_dir):
+    resets = [{"start_frame": 15}]
+    episodes = _run_async(frames_dir, resets)
+    _assert_episodes_equal(episodes, _run_sync(frames_dir, resets))
+    # Frames 15..19: reset plus 4 steps, the last one terminating
+    assert len(episodes[0]) == 5
+    assert episodes[0][-1][1]
@@ -0,0 +1,113 @@
+import os
+
+import numpy as np
+import pytest
+
+from gym_examples.utils import (
+    ObservationDecoder,
+    ObservationEncoder,
+    read_message,
+    write_message,
+)
+from gym_examples.utils.delta_codec import _HEADER, _KEYFRAME
+
+
+def _parse_header(message):
+    flags, h, w, c, tile_size, num_changed = _HEADER.unpack_from(message)
+    return bool(flags & _KEYFRAME), num_changed
+
+
+def _round_trip(encoder, decoder, obs):
+    message = encoder.encode(obs)
+    decoded = decoder.decode(message)
+    np.testing.assert_array_equal(decoded, obs)
+    return _parse_header(message)
+
+
+@pytest.mark.parametrize("shape", [(64, 48, 3), (50, 37, 3), (5, 7, 1)])
+def test_round_trip(shape):
+    rng = np.random.default_rng(0)
+    encoder = ObservationEncoder(tile_size=16)
+    decoder = ObservationDecoder()
+
+    obs = rng.integers(0, 256, size=shape, dtype=np.uint8)
+    # The first message is a keyframe
+    assert _round_trip(encoder, decoder, obs) == (True, 0)
+    # No change, no tiles
+    assert _round_trip(encoder, decoder, obs) == (False, 0)
+
+    # A change inside one tile, including the padded last tile
+    for y, x in [(0, 0), (shape[0] - 1, shape[1] - 1)]:
+        obs = obs.copy()
+        obs[y, x] ^= 0xFF
+        assert _round_trip(encoder, decoder, obs) == (False, 1)
+
+    # A change spanning several tiles
+    obs = obs.copy()
+    obs[: min(shape[0], 20), :] = 0
+    keyframe, num_changed = _round_trip(encoder, decoder, obs)
+    assert not keyframe and num_changed >= 1
+
+    for _ in range(5):
+        obs = rng.integers(0, 256, size=shape, dtype=np.uint8)
+        _round_trip(encoder, decoder, obs)
+
+
+def test_decoded_frames_are_not_aliased():
+    encoder = ObservationEncoder(tile_size=8)
+    decoder = ObservationDecoder()
+    obs = np.zeros((16, 16, 3), dtype=np.uint8)
+    decoded = decoder.decode(encoder.encode(obs))
+    decoded[:] = 1
+    np.testing.assert_array_equal(decoder.decode(encoder.encode(obs)), obs)
+
+
+def test_keyframe_interval():
+    rng = np.random.default_rng(0)
+    encoder = ObservationEncoder(tile_size=8, keyframe_interval=4)
+    decoder = ObservationDecoder()
+    keyframes = []
+    for _ in range(10):
+        obs = rng.integers(0, 256, size=(24, 24, 3), dtype=np.uint8)
+        keyframes.append(_round_trip(encoder, decoder, obs)[0])
+    assert keyframes == [i % 4 == 0 for i in range(10)]
+
+
+def test_shape_change_forces_keyframe():
+    encoder = ObservationEncoder(tile_size=8)
+    decoder = ObservationDecoder()
+    assert _round_trip(encoder, decoder, np.zeros((24, 24, 3), np.uint8))[0]
+    assert not _round_trip(encoder, decoder, np.ones((24, 24, 3), np.uint8))[0]
+    assert _round_trip(encoder, decoder, np.ones((20, 30, 3), np.uint8))[0]
+    assert not _round_trip(encoder, decoder, np.zeros((20, 30, 3), np.uint8))[0]
+
+
+def test_decoder_needs_keyframe_first():
+    encoder = ObservationEncoder()
+    obs = np.zeros((16, 16, 3), dtype=np.uint8)
+    encoder.encode(obs)
+    with pytest.raises(AssertionError):
+        ObservationDecoder().decode(encoder.encode(obs))
+
+
+def test_messages_over_pipe():
+    rng = np.random.default_rng(0)
+    encoder = ObservationEncoder(tile_size=8, keyframe_interval=3)
+    observations = [
+        rng.integers(0, 256, size=(20, 30, 3), dtype=np.uint8) for _ in range(5)
+    ]
+    observations.append(observations[-1])
+
+    r, w = os.pipe()
+    with os.fdopen(w, "wb") as writer:
+        for obs in observations:
+            write_message(writer, encoder.encode(obs))
+        # An empty message is distinct from EOF
+        write_message(writer, b"")
+
+    decoder = ObservationDecoder()
+    with os.fdopen(r, "rb") as reader:
+        for obs in observations:
+            np.testing.assert_array_equal(decoder.decode(read_message(reader)), obs)
+        assert read_message(reader) == b""
+        assert read_message(reader) is None
@@ -0,0 +1,85 @@
+import pytest
+
+from gym_examples.envs import PtzCameraRealEnv, UnrestrictedPtzCameraRealEnv
+from gym_examples.utils import EpisodeWindowSampler
+
+
+def _play(env, window):
+    observation, _ = env.reset(options=window)
+    frame_ids = [observation[0]]
+    while True:
+        observation, _, terminated, truncated, _ = env.step(4)
+        frame_ids.append(observation[0])
+        if terminated or truncated:
+            return frame_ids, terminated, truncated
+
+
+def test_window_is_truncated_at_its_end(frames_dir):
+    env = PtzCameraRealEnv(frames_dir, obs_mode="ref")
+    for window in [{"start_frame": 5, "length": 2}, {"start_frame": 3, "length": 6}]:
+        frame_ids, terminated, truncated = _play(env, window)
+        assert frame_ids == list(EpisodeWindowSampler.get_frame_ids(window))
+        assert truncated and not terminated
+
+
+def test_window_at_end_of_footage_terminates(frames_dir):
+    env = PtzCameraRealEnv(frames_dir, obs_mode="ref")
+    frame_ids, terminated, truncated = _play(env, {"start_frame": 17, "length": 3})
+    assert frame_ids == [17, 18, 19]
+    assert terminated and not truncated
+
+
+def test_too_short_window_is_rejected(frames_dir):
+    env = PtzCameraRealEnv(frames_dir, obs_mode="ref")
+    with pytest.raises(AssertionError):
+        env.reset(options={"start_frame": 5, "length": 1})
+    with pytest.raises(AssertionError):
+        EpisodeWindowSampler(20, 1)
+
+
+@pytest.mark.parametrize("start_frame", [-1, 20, 100])
+def test_start_frame_outside_footage_is_rejected(frames_dir, start_frame):
+    env = PtzCameraRealEnv(frames_dir, obs_mode="ref")
+    with pytest.raises(AssertionError):
+        env.reset(options={"start_frame": start_frame, "length": 3})
+
+
+@pytest.mark.parametrize("start_frame", [-1, 4, 13, 19])
+def test_start_frame_outside_unrestricted_range_is_rejected(frames_dir, start_frame):
+    env = UnrestrictedPtzCameraRealEnv(
+        frames_dir, start_frame_id=5, end_frame_id=12, obs_mode="ref"
+    )
+    with pytest.raises(AssertionError):
+        env.reset(options={"start_frame": start_frame, "length": 3})
+
+
+def test_unrestricted_window_terminates_at_end_frame(frames_dir):
+    env = UnrestrictedPtzCameraRealEnv(
+        frames_dir, start_frame_id=5, end_frame_id=12, obs_mode="ref"
+    )
+    observation, _ = env.reset(options={"start_frame": 10, "length": 5})
+    frame_ids = [observation[0]]
+    while True:
+        observation, _, terminated, truncated, _ = env.step((0, 0))
+        frame_ids.append(observation[0])
+        if terminated or truncated:
+            break
+    assert frame_ids == [10, 11, 12]
+    assert terminated and not truncated
+
+
+def test_plan_does_not_advance_sampler():
+    sampler = EpisodeWindowSampler(1000, 10, seed=1)
+    planned = sampler.plan(3)
+    assert [sampler.sample() for _ in range(3)] == planned
+    assert sampler.plan(2) == [sampler.sample(), sampler.sample()]
+
+
+def test_windows_only_depend_on_seed():
+    a = EpisodeWindowSampler(1000, 10, seed=1)
+    b = EpisodeWindowSampler(1000, 10, seed=1)
+    b.plan(5)
+    assert [a.sample() for _ in range(5)] == [b.sample() for _ in range(5)]
+    assert all(
+        0 <= w["start_frame"] <= 990 for w in EpisodeWindowSampler(1000, 10).plan(50)
+    )
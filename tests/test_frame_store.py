@@ -0,0 +1,38 @@
+import numpy as np
+import pytest
+
+from gym_examples.envs import PtzCameraRealEnv
+from gym_examples.utils import FrameStore
+
+ACTIONS = [0, 0, 1, 4, 2, 3, 3, 0, 1, 1, 4, 2]
+
+
+def _collect(frames_dir, obs_mode):
+    env = PtzCameraRealEnv(frames_dir, obs_mode=obs_mode)
+    observation, _ = env.reset()
+    observations = [observation]
+    for action in ACTIONS:
+        observation, _, _, _, _ = env.step(action)
+        observations.append(observation)
+    return env, np.stack(observations)
+
+
+@pytest.mark.parametrize("use_cache_path", [False, True])
+def test_gather_matches_pixels_observations(frames_dir, tmp_path, use_cache_path):
+    env, refs = _collect(frames_dir, "ref")
+    _, pixels = _collect(frames_dir, "pixels")
+
+    cache_path = tmp_path / "frames.npy" if use_cache_path else None
+    store = FrameStore(env, cache_path=cache_path, max_cached_frames=4)
+    assert len(store) == len(env.frames)
+    np.testing.assert_array_equal(store.gather(refs), pixels)
+    # Out of order and repeated references
+    idx = np.array([5, 0, 5, 12, 3])
+    np.testing.assert_array_equal(store.gather(refs[idx]), pixels[idx])
+
+    if use_cache_path:
+        # Reuses the existing file
+        store = FrameStore(env, cache_path=cache_path)
+        np.testing.assert_array_equal(store.gather(refs), pixels)
+    else:
+        assert len(store._decoded) <= 4
@@ -0,0 +1,56 @@
+import numpy as np
+
+from gym_examples.envs import GridWorldEnv
+
+
+def _assert_obs_equal(obs, obs_):
+    for key in ("agent", "target"):
+        np.testing.assert_array_equal(obs[key], obs_[key])
+        assert obs[key].dtype == obs_[key].dtype
+        assert obs[key].flags.writeable
+
+
+def test_tabular_matches_default_mode():
+    env = GridWorldEnv(size=7)
+    tabular = GridWorldEnv(size=7, tabular=True)
+    rng = np.random.default_rng(0)
+    for seed in range(10):
+        obs, info = env.reset(seed=seed)
+        obs_, info_ = tabular.reset(seed=seed)
+        _assert_obs_equal(obs, obs_)
+        assert info == info_ and isinstance(info_["distance"], float)
+        for _ in range(30):
+            action = int(rng.integers(4))
+            obs, reward, terminated, _, info = env.step(action)
+            obs_, reward_, terminated_, _, info_ = tabular.step(action)
+            _assert_obs_equal(obs, obs_)
+            assert (reward, terminated) == (reward_, terminated_)
+            assert info == info_ and isinstance(info_["distance"], float)
+            if terminated:
+                break
+
+
+def test_tabular_observations_do_not_alias_state():
+    env = GridWorldEnv(size=5, tabular=True)
+    obs, _ = env.reset(seed=0)
+    obs["agent"][:] = 0
+    obs["target"][:] = 0
+    obs, _, _, _, _ = env.step(0)
+    obs["agent"][:] = 0
+    np.testing.assert_array_equal(
+        env._state_to_location, np.stack(np.divmod(np.arange(25), 5), axis=1)
+    )
+
+
+def test_step_batch_and_reward_table():
+    env = GridWorldEnv(size=4)
+    target = 5
+    rewards = env.get_reward_table(target)
+    states = np.repeat(np.arange(env.num_states), 4)
+    actions = np.tile(np.arange(4), env.num_states)
+    next_states, batch_rewards, terminated = env.step_batch(
+        states, actions, np.full_like(states, target)
+    )
+    np.testing.assert_array_equal(next_states, env.transitions[states, actions])
+    np.testing.assert_array_equal(batch_rewards, rewards[states, actions])
+    np.testing.assert_array_equal(terminated, next_states == target)
@@ -0,0 +1,34 @@
+import numpy as np
+
+from gym_examples.envs import MultiPtzCameraRealEnv, PtzCameraRealEnv
+from gym_examples.utils.oracle_index import motion_energy
+
+
+def test_rewards_score_each_camera(frames_dir):
+    env = MultiPtzCameraRealEnv(frames_dir, num_cameras=3)
+    single = PtzCameraRealEnv(frames_dir)
+    env.reset()
+    single.reset()
+
+    for action in [[0, 4, 2], [1, 3, 4], [4, 4, 4]]:
+        prev_img = single.img
+        observation, reward, _, _, info = env.step(np.array(action))
+        single.step(4)
+
+        assert observation.shape == (
+            3,
+            single.viewport_size_y,
+            single.viewport_size_x,
+            3,
+        )
+        assert reward.shape == (3,)
+        for i, vp in enumerate(info["vps"]):
+            np.testing.assert_array_equal(
+                observation[i], single.get_view_of_viewport(vp)
+            )
+            expected = motion_energy(
+                single.get_view_of_viewport(vp), single._crop_viewport(prev_img, vp)
+            )
+            assert reward[i] == expected
+        # Random frames differ everywhere
+        assert (reward > 0).all()
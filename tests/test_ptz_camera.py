@@ -0,0 +1,46 @@
+import numpy as np
+import pytest
+from gymnasium.utils.env_checker import data_shares_objects
+
+from gym_examples.envs import PtzCameraEnv, UnrestrictedPtzCameraEnv
+
+
+def test_none_obs_mode_returns_fresh_arrays():
+    env = PtzCameraEnv(obs_mode="none")
+    observation, _ = env.reset(seed=0)
+    observation_, _, _, _, _ = env.step(4)
+    assert observation.shape == (0,)
+    assert env.observation_space.contains(observation_)
+    assert not data_shares_objects(observation, observation_)
+    assert not hasattr(env, "_empty_obs")
+
+
+def _brute_force_grid_stats(env):
+    cnt = np.zeros((env.num_grid_y, env.num_grid_x), dtype=np.int32)
+    vel_sum = np.zeros((env.num_grid_y, env.num_grid_x), dtype=np.float64)
+    for o in env.objects:
+        x, y = o.get_midpoint()
+        if 0 <= x < env.size_x and 0 <= y < env.size_y:
+            grid = (int(y // env.grid_size), int(x // env.grid_size))
+            cnt[grid] += 1
+            vel_sum[grid] += o.vel_x
+    return cnt, vel_sum
+
+
+@pytest.mark.parametrize("env_cls", [PtzCameraEnv, UnrestrictedPtzCameraEnv])
+def test_incremental_grid_stats_match_rescan(env_cls):
+    env = env_cls(obs_mode="occupancy")
+    env.reset(seed=0)
+    env.action_space.seed(0)
+    for _ in range(2000):
+        observation, _, _, _, info = env.step(env.action_space.sample())
+
+        cnt, vel_sum = _brute_force_grid_stats(env)
+        np.testing.assert_array_equal(env._grid_objcnt, cnt)
+        np.testing.assert_array_equal(observation[..., 0], cnt)
+        mean_vel = np.divide(vel_sum, cnt, out=np.zeros_like(vel_sum), where=cnt > 0)
+        np.testing.assert_allclose(observation[..., 1], mean_vel, rtol=1e-5, atol=1e-4)
+
+        for vp in env.get_all_vps():
+            assert info["vp_2_objcnt"][vp] == env._count_obj_in_vp(vp)
+        assert cnt.sum() <= info["gt_objcnt"]
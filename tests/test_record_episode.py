@@ -0,0 +1,93 @@
+import tracemalloc
+
+import numpy as np
+
+from gym_examples.envs import PtzCameraEnv, PtzCameraRealEnv
+from gym_examples.utils import EpisodeRecorder, NpzChunkSink
+from gym_examples.wrappers import RecordEpisodeFrames
+
+
+def _count_renders(env):
+    num_renders = [0]
+    render = env.render
+
+    def counting_render():
+        num_renders[0] += 1
+        return render()
+
+    env.render = counting_render
+    return num_renders
+
+
+def test_frame_skip_does_not_render_dropped_frames(tmp_path):
+    env = PtzCameraEnv(render_mode="rgb_array", obs_mode="none")
+    num_renders = _count_renders(env)
+    recorder = EpisodeRecorder(NpzChunkSink(tmp_path, chunk_size=8), frame_skip=10)
+    env = RecordEpisodeFrames(env, recorder)
+
+    env.reset(seed=0)
+    for _ in range(99):
+        env.step(4)
+    env.close()
+
+    assert num_renders[0] == 10
+    frames = np.load(tmp_path / "chunk_00000.npz")["frames"]
+    assert frames.shape == (8, env.unwrapped.size_y, env.unwrapped.size_x, 3)
+
+
+def test_recorded_frames_match_render(frames_dir, tmp_path):
+    env = PtzCameraRealEnv(frames_dir, render_mode="rgb_array")
+    expected = []
+    env.reset()
+    expected.append(env.render())
+    canvas = env._render_canvas
+    for action in [0, 1, 2, 3]:
+        env.step(action)
+        expected.append(env.render())
+    assert env._render_canvas is canvas
+
+    recorder = EpisodeRecorder(NpzChunkSink(tmp_path, chunk_size=5, compress=False))
+    env = RecordEpisodeFrames(
+        PtzCameraRealEnv(frames_dir, render_mode="rgb_array"), recorder
+    )
+    env.reset()
+    for action in [0, 1, 2, 3]:
+        env.step(action)
+    env.close()
+
+    frames = np.load(tmp_path / "chunk_00000.npz")["frames"]
+    np.testing.assert_array_equal(frames, np.stack(expected))
+    # Reusing the canvas does not overwrite the frames returned earlier
+    assert not np.array_equal(expected[0], expected[-1])
+
+
+def test_long_episode_memory_is_bounded(tmp_path):
+    env = PtzCameraEnv(render_mode="rgb_array", obs_mode="none")
+    frame_nbytes = env.size_x * env.size_y * 3
+    chunk_size = 16
+    recorder = EpisodeRecorder(NpzChunkSink(tmp_path, chunk_size=chunk_size))
+    env = RecordEpisodeFrames(env, recorder)
+
+    env.reset(seed=0)
+    # Warm up, so that the chunk buffer and the render canvas exist
+    for _ in range(2 * chunk_size):
+        env.step(4)
+
+    canvas = env.unwrapped._render_canvas
+    tracemalloc.start()
+    try:
+        start, _ = tracemalloc.get_traced_memory()
+        for _ in range(1000):
+            env.step(4)
+        end, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    env.close()
+
+    # pygame surfaces are not traced, so check that the canvas is reused
+    assert env.unwrapped._render_canvas is canvas
+
+    # Nothing accumulates over the episode
+    assert end - start < frame_nbytes
+    # Saving a chunk may copy it, but nothing scales with the episode length
+    assert peak - start < (chunk_size + 4) * frame_nbytes
@@ -0,0 +1,83 @@
+import numpy as np
+import pytest
+
+from gym_examples.envs import (
+    ContinuousPtzCameraEnv,
+    ContinuousPtzCameraRealEnv,
+    PtzCameraRealEnv,
+)
+from gym_examples.utils import ViewportResampler
+
+
+def _reference_resample(img, rect, viewport_wh):
+    left, top, crop_w, crop_h, _ = rect
+    viewport_w, viewport_h = viewport_wh
+    rows = [int((i + 0.5) * crop_h / viewport_h) for i in range(viewport_h)]
+    cols = [int((j + 0.5) * crop_w / viewport_w) for j in range(viewport_w)]
+    crop = img[top : top + crop_h, left : left + crop_w]
+    return crop[np.ix_(rows, cols)]
+
+
+@pytest.mark.parametrize(
+    "panoramic_wh, viewport_wh, min_zoom",
+    [((450, 250), (250, 150), 1.0), ((97, 61), (40, 30), 0.5)],
+)
+def test_every_zoom_level(panoramic_wh, viewport_wh, min_zoom):
+    resampler = ViewportResampler(
+        panoramic_wh, viewport_wh, min_zoom=min_zoom, max_zoom=4.0, num_zoom_levels=32
+    )
+    img = np.random.default_rng(0).integers(
+        0, 256, size=panoramic_wh[::-1] + (3,), dtype=np.uint8
+    )
+    # Also a panorama whose pixels are not contiguous, as pygame's
+    strided = np.zeros(panoramic_wh[::-1] + (4,), dtype=np.uint8)
+    strided[..., :3] = img
+    strided = strided[..., :3]
+
+    for zoom in resampler.zooms:
+        for x, y in [(0, 0), (1, 1), (0.5, 0.5), (0.3, 0.8)]:
+            rect = resampler.get_rect(x, y, zoom)
+            left, top, crop_w, crop_h, _ = rect
+            assert 0 <= left and left + crop_w <= panoramic_wh[0]
+            assert 0 <= top and top + crop_h <= panoramic_wh[1]
+            assert crop_w == max(round(viewport_wh[0] / zoom), 1)
+
+            expected = _reference_resample(img, rect, viewport_wh)
+            for panorama in (img, strided):
+                out = resampler.resample(panorama, rect)
+                assert out.shape == viewport_wh[::-1] + (3,)
+                np.testing.assert_array_equal(out, expected)
+
+
+def test_zoom_1_on_grid_matches_ptz_camera_real_env(frames_dir):
+    env = ContinuousPtzCameraRealEnv(frames_dir)
+    grid_env = PtzCameraRealEnv(frames_dir)
+    env.reset()
+    grid_env.reset()
+
+    max_x = env.img_w - env.viewport_size_x
+    max_y = env.img_h - env.viewport_size_y
+    max_vp_x = env.num_grid_x - env.num_grid_viewport_x
+    max_vp_y = env.num_grid_y - env.num_grid_viewport_y
+    for vp_x in range(max_vp_x + 1):
+        for vp_y in range(max_vp_y + 1):
+            action = np.array(
+                [vp_x * env.grid_size_x / max_x, vp_y * env.grid_size_y / max_y, 1.0],
+                dtype=np.float32,
+            )
+            observation, _, _, _, info = env.step(action)
+            grid_env.step(4)
+            assert info["vp"][:2] == (vp_x * env.grid_size_x, vp_y * env.grid_size_y)
+            np.testing.assert_array_equal(
+                observation, grid_env.get_view_of_viewport((vp_x, vp_y))
+            )
+
+
+def test_continuous_envs_share_viewport_logic(frames_dir):
+    for env in [ContinuousPtzCameraEnv(), ContinuousPtzCameraRealEnv(frames_dir)]:
+        env.reset(seed=0)
+        observation, _, _, _, info = env.step(np.array([1, 0, 4], dtype=np.float32))
+        assert env.observation_space.contains(observation)
+        assert info["vp"] == env.viewport_rect[:4]
+        assert env.viewport_rect[4] == len(env.resampler.zooms) - 1
+    assert "gt_objcnt" in ContinuousPtzCameraEnv().reset(seed=0)[1]
@@ -0,0 +1,48 @@
+import gymnasium as gym
+import pytest
+
+import gym_examples  # noqa: F401
+from gym_examples.utils.step_memory import (
+    StepMemoryReport,
+    get_env_ids,
+    is_over_budget,
+    measure_step_memory,
+    needs_frames_dir,
+)
+
+
+@pytest.mark.parametrize(
+    "env_id, kwargs",
+    [
+        ("gym_examples/GridWorld-v0", {}),
+        ("gym_examples/PtzCamera", {"obs_mode": "none"}),
+        ("gym_examples/UnrestrictedPtzCamera", {"obs_mode": "none"}),
+    ],
+)
+def test_step_memory_within_budget(env_id, kwargs):
+    env = gym.make(env_id, disable_env_checker=True, **kwargs)
+    report = measure_step_memory(env, num_steps=2000, warmup_steps=200)
+    env.close()
+    assert not is_over_budget(report, max_step_bytes=4096, max_growth_bytes=16), report
+
+
+def test_is_over_budget():
+    report = StepMemoryReport(
+        mean_step_bytes=1000,
+        max_step_bytes=2000,
+        peak_bytes=5000,
+        growth_bytes_per_step=10,
+    )
+    assert not is_over_budget(report)
+    assert not is_over_budget(report, max_step_bytes=1000, max_growth_bytes=10)
+    assert is_over_budget(report, max_step_bytes=999)
+    assert is_over_budget(report, max_growth_bytes=9)
+
+
+def test_footage_envs_need_frames_dir():
+    env_ids = get_env_ids()
+    assert "gym_examples/PtzCamera" in env_ids
+    for env_id in gym.registry:
+        if env_id.startswith("gym_examples/"):
+            assert needs_frames_dir(env_id) == ("Real" in env_id)
+            assert (env_id in env_ids) != needs_frames_dir(env_id)
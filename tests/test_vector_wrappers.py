@@ -0,0 +1,68 @@
+import subprocess
+import sys
+
+import gymnasium as gym
+import numpy as np
+
+import gym_examples  # noqa: F401
+from gym_examples.envs import PtzCameraEnv
+from gym_examples.wrappers.vector import (
+    VectorClipReward,
+    VectorDiscreteActions,
+    VectorPtzMoveActions,
+    VectorRelativePosition,
+)
+
+
+def test_vector_wrappers_do_not_import_legacy_gym():
+    code = (
+        "import sys; import gym_examples.wrappers.vector; "
+        "assert 'gym' not in sys.modules"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_ptz_move_actions_match_ptz_camera_env():
+    envs = VectorClipReward(
+        VectorPtzMoveActions(
+            gym.make_vec(
+                "gym_examples/UnrestrictedPtzCamera",
+                num_envs=3,
+                vectorization_mode="sync",
+                obs_mode="none",
+            )
+        ),
+        0,
+        2,
+    )
+    refs = [PtzCameraEnv(obs_mode="none") for _ in range(3)]
+    envs.reset(seed=0)
+    for ref in refs:
+        ref.reset(seed=0)
+
+    rng = np.random.default_rng(0)
+    for _ in range(30):
+        actions = rng.integers(0, 5, size=3)
+        _, rewards, _, _, infos = envs.step(actions)
+        for i, ref in enumerate(refs):
+            ref.step(int(actions[i]))
+            assert tuple(infos["vp"][i]) == ref.viewport_grid_loc
+        assert ((rewards >= 0) & (rewards <= 2)).all()
+    envs.close()
+
+
+def test_discrete_actions_and_relative_position():
+    envs = VectorRelativePosition(
+        VectorDiscreteActions(
+            gym.make_vec(
+                "gym_examples/GridWorld-v0", num_envs=3, vectorization_mode="sync"
+            ),
+            [3, 2, 1, 0],
+        )
+    )
+    observations, _ = envs.reset(seed=0)
+    assert observations.shape == (3, 2)
+    assert envs.single_action_space.n == 4
+    observations, *_ = envs.step(np.array([0, 1, 2]))
+    assert observations.shape == (3, 2)
+    envs.close()